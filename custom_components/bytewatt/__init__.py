@@ -23,6 +23,9 @@ from .const import (
     CONF_NOTIFY_ON_RECOVERY,
     CONF_DIAGNOSTICS_MODE,
     CONF_AUTO_RECONNECT_TIME,
+    CONF_SETTINGS_MAX_RETRIES,
+    CONF_SETTINGS_PARTIAL_PUT,
+    CONF_SETTINGS_RETRY_DELAY,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_RECOVERY_ENABLED,
     DEFAULT_HEARTBEAT_INTERVAL,
@@ -31,6 +34,9 @@ from .const import (
     DEFAULT_NOTIFY_ON_RECOVERY,
     DEFAULT_DIAGNOSTICS_MODE,
     DEFAULT_AUTO_RECONNECT_TIME,
+    DEFAULT_SETTINGS_MAX_RETRIES,
+    DEFAULT_SETTINGS_PARTIAL_PUT,
+    DEFAULT_SETTINGS_RETRY_DELAY,
     SERVICE_SET_DISCHARGE_TIME,
     SERVICE_SET_DISCHARGE_START_TIME,
     SERVICE_SET_CHARGE_START_TIME,
@@ -80,6 +86,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     client = ByteWattClient(hass, username, password)
 
+    # Settings API retry tuning, read by BatterySettingsAPI
+    client.api_client.options = {
+        CONF_SETTINGS_MAX_RETRIES: options.get(CONF_SETTINGS_MAX_RETRIES, DEFAULT_SETTINGS_MAX_RETRIES),
+        CONF_SETTINGS_RETRY_DELAY: options.get(CONF_SETTINGS_RETRY_DELAY, DEFAULT_SETTINGS_RETRY_DELAY),
+        CONF_SETTINGS_PARTIAL_PUT: options.get(CONF_SETTINGS_PARTIAL_PUT, DEFAULT_SETTINGS_PARTIAL_PUT),
+    }
+
     coordinator = ByteWattDataUpdateCoordinator(
         hass,
         client=client,
@@ -129,7 +142,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         )
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        client = data.get("client")
+        if client:
+            # Close the dedicated aiohttp session so a reload doesn't leak
+            # it (and its stop listener)
+            await client.api_client.async_close()
 
     return unload_ok
 
@@ -1,21 +1,98 @@
 """API client for Neovolt battery systems."""
 import logging
 import asyncio
+import random
+import time
 import aiohttp
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.util import dt as dt_util
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
 
+from ..utilities.circuit_breaker import CircuitBreaker
 from .neovolt_auth import encrypt_password
 
+# orjson ships with Home Assistant core and parses 2-10x faster than the
+# stdlib; fall back gracefully if it is ever unavailable.
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        """Parse JSON bytes with orjson."""
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes with orjson."""
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json as _stdlib_json
+
+    def _json_loads(data: bytes) -> Any:
+        """Parse JSON bytes with the stdlib json module."""
+        return _stdlib_json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes with the stdlib json module."""
+        return _stdlib_json.dumps(obj).encode("utf-8")
+
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 30
 DEFAULT_BASE_URL = "https://monitor.byte-watt.com"
 
+# Retry/backoff tuning for transient upstream errors
+RETRY_ATTEMPTS = 4
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_BASE_DELAY = 0.5  # seconds
+RETRY_MAX_DELAY = 8.0  # seconds
+
+# Circuit breaker tuning: back off the API for a minute once it looks down
+BREAKER_RECOVERY_TIMEOUT = 60  # seconds
+
+# Token persistence; the key is suffixed per account so that two config
+# entries never share (and clobber) each other's bearer token
+TOKEN_STORAGE_VERSION = 1
+TOKEN_STORAGE_KEY_PREFIX = "bytewatt_token"
+TOKEN_LIFETIME = timedelta(hours=12)  # Conservative default when the API gives no expiry
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
+
+# Battery data cache
+BATTERY_DATA_TTL = timedelta(seconds=10)
+
+# Fixed start of the lifetime-statistics date range
+STATS_BEGIN_DATE = "2020-01-01"
+
+# Lifetime statistics only move slowly within a day, so they can be reused
+# across several polls.
+STATS_CACHE_TTL = timedelta(seconds=300)
+
+# Bulkhead: cap on concurrent in-flight requests per client instance so a
+# burst of coordinators/services cannot flood the vendor API with sockets.
+BULKHEAD_LIMIT = 4
+
+# Upper bound on concurrent endpoint fetches within one poll; matches the
+# connector's per-host connection budget so the fan-out never queues behind
+# itself or trips server-side rate limits.
+FANOUT_CONCURRENCY = 3
+
+# Headers that never change between requests; merged with the Authorization
+# header (and a per-call operationDate where required) instead of being
+# rebuilt dict-by-dict on every poll.
+STATIC_API_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/plain, */*",
+    # aiohttp decompresses transparently; advertising gzip shrinks the large
+    # statistics payloads considerably on the wire.
+    "Accept-Encoding": "gzip, deflate",
+    "language": "en-US",
+    "platform": "AK9D8H",
+    "System": "alphacloud",
+}
+
 class NeovoltClient:
     """API Client for Neovolt battery systems."""
 
@@ -31,9 +108,224 @@ class NeovoltClient:
         self.username = username
         self.password = password
         self.base_url = base_url
-        self.session = async_get_clientsession(hass)
+        # Integration options (retry tuning etc.), populated at setup
+        self.options: Dict[str, Any] = {}
+        self._encrypted_password: Optional[str] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._remove_stop_listener = None
         self.token: Optional[str] = None
+        self._token_expires_at: Optional[datetime] = None
+        self._token_store = Store(
+            hass, TOKEN_STORAGE_VERSION, f"{TOKEN_STORAGE_KEY_PREFIX}_{slugify(username)}"
+        )
+        self._token_store_loaded = False
         self._settings_cache = None
+        self._settings_api = None
+        self._battery_cache: Dict[str, tuple] = {}
+        self._battery_locks: Dict[str, asyncio.Lock] = {}
+        self._stats_cache: Dict[Tuple[str, str], Tuple[datetime, Dict[str, Any]]] = {}
+        self._device_list_cache: Optional[Tuple[str, Dict[str, Any]]] = None
+        self._breaker = CircuitBreaker(recovery_timeout=BREAKER_RECOVERY_TIMEOUT)
+        self._fanout_semaphore = asyncio.Semaphore(FANOUT_CONCURRENCY)
+        self._bulkhead = asyncio.Semaphore(BULKHEAD_LIMIT)
+
+    async def _bounded(self, coro):
+        """Run an endpoint fetch under the fan-out concurrency bound."""
+        async with self._fanout_semaphore:
+            return await coro
+
+    @staticmethod
+    async def _parse_json(response: aiohttp.ClientResponse) -> Optional[Dict[str, Any]]:
+        """Parse a response body as JSON, feeding orjson raw bytes."""
+        body = await response.read()
+        if not body:
+            return None
+        try:
+            return _json_loads(body)
+        except ValueError as error:
+            _LOGGER.error("Could not parse JSON response: %s", error)
+            return None
+
+    async def _async_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, str]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        description: str = "request",
+    ) -> Optional[Tuple[int, Optional[Dict[str, Any]], str]]:
+        """Perform one HTTP request with circuit breaker and jittered backoff.
+
+        Transient errors (timeouts, connection errors and 429/5xx statuses)
+        are retried with bounded exponential backoff and full jitter so a
+        flaky upstream is not hammered on every coordinator tick. When the
+        circuit breaker is open the call short-circuits without touching the
+        socket. 4xx statuses other than 429 are never retried; the caller
+        owns the 401 re-login path.
+
+        Returns a (status, parsed_json, raw_text) tuple, or None if all
+        attempts failed or the breaker is open.
+        """
+        if not self._breaker.can_execute():
+            _LOGGER.warning(
+                "Circuit breaker is %s, skipping %s", self._breaker.state.value, description
+            )
+            return None
+
+        for attempt in range(RETRY_ATTEMPTS):
+            start = time.monotonic()
+            try:
+                # The bulkhead is re-acquired per attempt so a slot is not
+                # held while sleeping through a backoff delay.
+                async with self._bulkhead, asyncio.timeout(DEFAULT_TIMEOUT):
+                    response = await self.session.request(
+                        method,
+                        url,
+                        params=params,
+                        data=_json_dumps(json_data) if json_data is not None else None,
+                        headers=headers,
+                    )
+                    status = response.status
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "%s response encoding: %s",
+                            description,
+                            response.headers.get("Content-Encoding", "identity"),
+                        )
+                    # Only decode the raw body when debugging or on an error
+                    # path; the unconditional decode costs O(bytes) per poll.
+                    raw_text = ""
+                    if _LOGGER.isEnabledFor(logging.DEBUG) or status != 200:
+                        raw_text = await response.text()
+                    result = None
+                    if response.content_type == "application/json":
+                        result = await self._parse_json(response)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as error:
+                self._breaker.record_failure(type(error).__name__, str(error))
+                if attempt >= RETRY_ATTEMPTS - 1:
+                    _LOGGER.error("Error during %s: %s", description, error)
+                    return None
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+                _LOGGER.debug(
+                    "Transient error during %s (%s), retrying in %.2fs", description, error, delay
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if status in RETRY_STATUSES:
+                self._breaker.record_failure("HTTPStatus", str(status))
+                if attempt >= RETRY_ATTEMPTS - 1:
+                    _LOGGER.error(
+                        "%s failed with status %s after %s attempts",
+                        description, status, RETRY_ATTEMPTS
+                    )
+                    return status, result, raw_text
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+                _LOGGER.debug(
+                    "%s returned status %s, retrying in %.2fs", description, status, delay
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            self._breaker.record_success(time.monotonic() - start)
+            return status, result, raw_text
+
+        return None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the dedicated client session, creating it on first use.
+
+        A session with its own keep-alive tuned TCPConnector avoids a fresh
+        TLS handshake on every poll cycle and caches DNS lookups for the
+        single API host, unlike the HA-shared session defaults.
+        """
+        if self._session is None or self._session.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit_per_host=4,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=self._connector,
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+            )
+            self._remove_stop_listener = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_close
+            )
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the dedicated client session, e.g. when the entry unloads."""
+        await self._async_close()
+
+    async def _async_close(self, _event=None) -> None:
+        """Close the dedicated client session and drop the stop listener."""
+        if _event is None and self._remove_stop_listener is not None:
+            self._remove_stop_listener()
+        self._remove_stop_listener = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._connector = None
+
+    async def _ensure_token(self) -> bool:
+        """Make sure a usable token is available, logging in only when needed.
+
+        On first use the token persisted by a previous run is loaded from
+        storage, so a restart (or a transient disconnect) skips the full
+        encrypted-login round-trip while the token is still valid.
+        """
+        if not self._token_store_loaded:
+            self._token_store_loaded = True
+            try:
+                stored = await self._token_store.async_load()
+            except Exception as error:
+                _LOGGER.warning("Could not load stored token: %s", error)
+                stored = None
+
+            if stored and stored.get("token") and stored.get("exp"):
+                expires_at = dt_util.parse_datetime(stored["exp"])
+                if expires_at and dt_util.utcnow() < expires_at - TOKEN_EXPIRY_MARGIN:
+                    self.token = stored["token"]
+                    self._token_expires_at = expires_at
+                    _LOGGER.debug("Reusing stored token valid until %s", expires_at)
+
+        if (
+            self.token
+            and self._token_expires_at
+            and dt_util.utcnow() < self._token_expires_at - TOKEN_EXPIRY_MARGIN
+        ):
+            return True
+
+        return await self.async_login()
+
+    async def _async_store_token(self, result: Dict[str, Any]) -> None:
+        """Record the token expiry and persist it for the next run."""
+        expires_in = None
+        if isinstance(result.get("data"), dict):
+            expires_in = result["data"].get("expiresIn")
+        expires_in = result.get("expiresIn", expires_in)
+
+        if expires_in:
+            try:
+                self._token_expires_at = dt_util.utcnow() + timedelta(seconds=int(expires_in))
+            except (ValueError, TypeError):
+                self._token_expires_at = dt_util.utcnow() + TOKEN_LIFETIME
+        else:
+            self._token_expires_at = dt_util.utcnow() + TOKEN_LIFETIME
+
+        try:
+            await self._token_store.async_save({
+                "token": self.token,
+                "exp": self._token_expires_at.isoformat()
+            })
+        except Exception as error:
+            _LOGGER.warning("Could not persist token: %s", error)
 
     async def async_login(self) -> bool:
         """Login to the Neovolt API using encrypted password."""
@@ -41,8 +333,11 @@ class NeovoltClient:
 
         login_url = f"{self.base_url}/api/usercenter/cloud/user/login"
 
-        # Encrypt password using the correct method
-        encrypted_password = encrypt_password(self.password, self.username)
+        # Encrypt password using the correct method; the credentials never
+        # change for a client instance, so the AES work is done only once.
+        if self._encrypted_password is None:
+            self._encrypted_password = encrypt_password(self.password, self.username)
+        encrypted_password = self._encrypted_password
 
         # JSON payload with encrypted password
         payload = {
@@ -51,16 +346,18 @@ class NeovoltClient:
         }
 
         try:
-            async with asyncio.timeout(DEFAULT_TIMEOUT):
+            async with self._bulkhead, asyncio.timeout(DEFAULT_TIMEOUT):
                 response = await self.session.post(
                     url=login_url,
                     json=payload,
                     headers={"Content-Type": "application/json"}
                 )
 
-                _LOGGER.debug(f"Login response status: {response.status}")
-                raw_text = await response.text()
-                _LOGGER.debug(f"Login raw response: {raw_text}")
+                _LOGGER.debug("Login response status: %s", response.status)
+                raw_text = ""
+                if _LOGGER.isEnabledFor(logging.DEBUG) or response.status != 200:
+                    raw_text = await response.text()
+                    _LOGGER.debug("Login raw response: %s", raw_text)
 
                 if response.status != 200:
                     _LOGGER.error(
@@ -70,12 +367,16 @@ class NeovoltClient:
                     )
                     return await self._async_login_fallback()
 
-                result = await response.json()
+                result = await self._parse_json(response)
+                if result is None:
+                    _LOGGER.error("Login response was not valid JSON")
+                    return await self._async_login_fallback()
 
-                if result.get("code") != 0 and result.get("code") != 200:
+                code = result.get("code")
+                if code not in (0, 200):
                     _LOGGER.error(
                         "Login failed with code %s: %s",
-                        result.get("code"),
+                        code,
                         result.get("msg")
                     )
                     return await self._async_login_fallback()
@@ -89,6 +390,8 @@ class NeovoltClient:
                     _LOGGER.error("No token found in login response")
                     return False
 
+                await self._async_store_token(result)
+
                 _LOGGER.debug("Successfully logged in to Neovolt API")
                 return True
 
@@ -109,15 +412,17 @@ class NeovoltClient:
         }
 
         try:
-            async with asyncio.timeout(DEFAULT_TIMEOUT):
+            async with self._bulkhead, asyncio.timeout(DEFAULT_TIMEOUT):
                 response = await self.session.post(
                     url=login_url,
                     data=form_data
                 )
 
-                _LOGGER.debug(f"Fallback login response status: {response.status}")
-                raw_text = await response.text()
-                _LOGGER.debug(f"Fallback login raw response: {raw_text}")
+                _LOGGER.debug("Fallback login response status: %s", response.status)
+                raw_text = ""
+                if _LOGGER.isEnabledFor(logging.DEBUG) or response.status != 200:
+                    raw_text = await response.text()
+                    _LOGGER.debug("Fallback login raw response: %s", raw_text)
 
                 if response.status != 200:
                     _LOGGER.error(
@@ -127,12 +432,16 @@ class NeovoltClient:
                     )
                     return False
 
-                result = await response.json()
+                result = await self._parse_json(response)
+                if result is None:
+                    _LOGGER.error("Fallback login response was not valid JSON")
+                    return False
 
-                if result.get("code") != 0 and result.get("code") != 200:
+                code = result.get("code")
+                if code not in (0, 200):
                     _LOGGER.error(
                         "Fallback login failed with code %s: %s",
-                        result.get("code"),
+                        code,
                         result.get("msg")
                     )
                     return False
@@ -146,6 +455,8 @@ class NeovoltClient:
                     _LOGGER.error("No token found in fallback login response")
                     return False
 
+                await self._async_store_token(result)
+
                 _LOGGER.debug("Successfully logged in with fallback method")
                 return True
 
@@ -154,273 +465,347 @@ class NeovoltClient:
             return False
 
     async def async_get_device_list(self) -> Optional[Dict[str, Any]]:
-        """Get the list of devices."""
-        if not self.token:
-            if not await self.async_login():
-                return None
+        """Get the list of devices.
+
+        The device inventory rarely changes, so the last body is cached
+        alongside its ETag and revalidated with If-None-Match; a 304 reply
+        skips the body transfer and JSON parse entirely. A 401 triggers at
+        most one re-login and retry; the loop is iterative so a persistent
+        auth failure cannot recurse.
+        """
+        if not await self._ensure_token():
+            return None
 
         url = f"{self.base_url}/api/devices/list"
 
-        try:
-            async with asyncio.timeout(DEFAULT_TIMEOUT):
-                response = await self.session.get(
-                    url=url,
-                    headers=self._get_auth_headers()
-                )
+        headers = self._get_auth_headers()
+        if self._device_list_cache:
+            headers["If-None-Match"] = self._device_list_cache[0]
+
+        for attempt in range(2):
+            try:
+                async with self._bulkhead, asyncio.timeout(DEFAULT_TIMEOUT):
+                    response = await self.session.get(
+                        url=url,
+                        headers=headers
+                    )
 
-                _LOGGER.debug(f"Device list response status: {response.status}")
-                raw_text = await response.text()
-                _LOGGER.debug(f"Device list raw response: {raw_text}")
+                    _LOGGER.debug("Device list response status: %s", response.status)
 
-                if response.status != 200:
-                    _LOGGER.error(
-                        "Failed to get device list with status %s: %s",
-                        response.status,
-                        raw_text
-                    )
+                    if response.status == 304 and self._device_list_cache:
+                        _LOGGER.debug("Device list not modified, returning cached data")
+                        return self._device_list_cache[1]
 
-                    # Try refreshing token and retrying the request
-                    if response.status == 401:
-                        if await self.async_login():
-                            return await self.async_get_device_list()
+                    raw_text = ""
+                    if _LOGGER.isEnabledFor(logging.DEBUG) or response.status != 200:
+                        raw_text = await response.text()
+                        _LOGGER.debug("Device list raw response: %s", raw_text)
 
-                    return None
+                    if response.status == 401 and attempt == 0:
+                        _LOGGER.debug("Device list returned 401, refreshing token")
+                        if not await self.async_login():
+                            return None
+                        headers["Authorization"] = f"Bearer {self.token}"
+                        continue
 
-                result = await response.json()
+                    if response.status != 200:
+                        _LOGGER.error(
+                            "Failed to get device list with status %s: %s",
+                            response.status,
+                            raw_text
+                        )
+                        return None
 
-                if result.get("code") != 0 and result.get("code") != 200:
-                    _LOGGER.error(
-                        "Failed to get device list with code %s: %s",
-                        result.get("code"),
-                        result.get("msg")
-                    )
-                    return None
+                    result = await self._parse_json(response)
+                    if result is None:
+                        _LOGGER.error("Device list response was not valid JSON")
+                        return None
 
-                return result.get("data")
+                    code = result.get("code")
+                    if code not in (0, 200):
+                        _LOGGER.error(
+                            "Failed to get device list with code %s: %s",
+                            code,
+                            result.get("msg")
+                        )
+                        return None
 
-        except (asyncio.TimeoutError, aiohttp.ClientError) as error:
-            _LOGGER.error("Error fetching device list: %s", error)
-            return None
+                    data = result.get("data")
 
-    async def async_get_battery_data(self, station_id: str = None) -> Optional[Dict[str, Any]]:
-        """Get data for a specific battery using the new API endpoint."""
-        if not self.token:
-            if not await self.async_login():
+                    etag = response.headers.get("ETag")
+                    if etag and data is not None:
+                        self._device_list_cache = (etag, data)
+
+                    return data
+
+            except (asyncio.TimeoutError, aiohttp.ClientError) as error:
+                _LOGGER.error("Error fetching device list: %s", error)
                 return None
 
-        url = f"{self.base_url}/api/report/energyStorage/getLastPowerData"
+        return None
+
+    async def _fetch_json(
+        self,
+        description: str,
+        url: str,
+        params: Dict[str, str],
+        headers: Dict[str, str],
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch and parse a GET endpoint, re-logging in once on a 401."""
+        for attempt in range(2):
+            fetched = await self._async_request(
+                "GET", url, params=params, headers=headers, description=description
+            )
+            if fetched is None:
+                return None
+
+            status, result, raw_text = fetched
+            _LOGGER.debug("%s response status: %s", description, status)
+            _LOGGER.debug("%s raw response: %s", description, raw_text)
+
+            if status == 401 and attempt == 0:
+                _LOGGER.debug("%s returned 401, refreshing token", description)
+                if not await self.async_login():
+                    return None
+                headers["Authorization"] = f"Bearer {self.token}"
+                continue
+
+            if status != 200 or result is None:
+                _LOGGER.error(
+                    "Failed to get %s with status %s: %s",
+                    description,
+                    status,
+                    raw_text
+                )
+                return None
+
+            code = result.get("code")
+            if code not in (0, 200):
+                _LOGGER.error(
+                    "Failed to get %s with code %s: %s",
+                    description,
+                    code,
+                    result.get("msg")
+                )
+                return None
+
+            return result.get("data")
+
+        return None
 
+    async def _fetch_power(
+        self, station_id: Optional[str], headers: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch the latest power readings."""
+        url = f"{self.base_url}/api/report/energyStorage/getLastPowerData"
         params = {
             "sysSn": "All",
             "stationId": station_id or ""
         }
+        power_data = await self._fetch_json("battery power data", url, params, headers)
+        if power_data and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received battery power data keys: %s", list(power_data.keys()))
+        return power_data
 
-        current_date = dt_util.now().strftime("%Y-%m-%d %H:%M:%S")
+    async def _fetch_stats(
+        self,
+        station_id: Optional[str],
+        headers: Dict[str, str],
+        begin_date: str,
+        end_date: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch lifetime energy statistics mapped to integration keys.
+
+        The aggregate only changes slowly within a day, so the mapped result
+        is cached per (station, end date) for STATS_CACHE_TTL and most polls
+        skip this request entirely.
+        """
+        cache_key = (station_id or "", end_date)
+        cached = self._stats_cache.get(cache_key)
+        if cached and dt_util.utcnow() - cached[0] < STATS_CACHE_TTL:
+            _LOGGER.debug("Returning cached energy statistics for %s", cache_key)
+            return cached[1]
+
+        url = f"{self.base_url}/api/report/energy/getEnergyStatistics"
+        params = {
+            "sysSn": "All",
+            "stationId": station_id or "",
+            "beginDate": begin_date,
+            "endDate": end_date
+        }
 
-        headers = self._get_auth_headers()
-        headers.update({
-            "Accept": "application/json, text/plain, */*",
-            "language": "en-US",
-            "operationDate": current_date,
-            "platform": "AK9D8H",
-            "System": "alphacloud"
-        })
+        stats_data = await self._fetch_json("energy statistics", url, params, headers)
+        if not stats_data:
+            return None
 
-        try:
-            battery_data = {}
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Energy statistics data fields: %s", list(stats_data.keys()))
+        mapped = {
+            "Total_Solar_Generation": stats_data.get("epvT"),
+            "Total_Feed_In": stats_data.get("eout"),
+            "Total_Battery_Charge": stats_data.get("echarge"),
+            "PV_Power_House": stats_data.get("epv2load"),
+            "PV_Charging_Battery": stats_data.get("epvcharge"),
+            "Total_House_Consumption": stats_data.get("eload"),
+            "Grid_Based_Battery_Charge": stats_data.get("egridCharge"),
+            "Grid_Power_Consumption": stats_data.get("einput"),
+        }
 
-            async with asyncio.timeout(DEFAULT_TIMEOUT):
-                response = await self.session.get(
-                    url=url,
-                    params=params,
-                    headers=headers
-                )
+        self._stats_cache[cache_key] = (dt_util.utcnow(), mapped)
+        # Prune entries for earlier end dates; their keys are never hit again
+        self._stats_cache = {
+            key: value for key, value in self._stats_cache.items()
+            if key[1] >= end_date
+        }
+        return mapped
 
-                _LOGGER.debug(f"Battery data response status: {response.status}")
-                raw_text = await response.text()
-                _LOGGER.debug(f"Battery data raw response: {raw_text}")
+    async def _fetch_today(
+        self, station_id: Optional[str], headers: Dict[str, str], today_date: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch today's summary statistics mapped to integration keys."""
+        url = f"{self.base_url}/api/stable/home/getSumDataForCustomer"
+        params = {
+            "sn": "All",
+            "stationId": station_id or "",
+            "tday": today_date
+        }
 
-                if response.status != 200:
-                    _LOGGER.error(
-                        "Failed to get battery power data with status %s: %s",
-                        response.status,
-                        raw_text
-                    )
+        today_data = await self._fetch_json("today's stats", url, params, headers)
+        if not today_data:
+            return None
 
-                    if response.status == 401:
-                        if await self.async_login():
-                            return await self.async_get_battery_data(station_id)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Today's stats data fields: %s", list(today_data.keys()))
+        mapped = {
+            "PV_Generated_Today": today_data.get("epvtoday"),
+            "Total_PV_Generation": today_data.get("epvtotal"),
+            "Consumed_Today": today_data.get("eload"),
+            "Feed_In_Today": today_data.get("eoutput"),
+            "Grid_Import_Today": today_data.get("einput"),
+            "Battery_Charged_Today": today_data.get("echarge"),
+            "Battery_Discharged_Today": today_data.get("edischarge"),
+            "Trees_Planted": today_data.get("treeNum"),
+            "Today_Income": today_data.get("todayIncome"),
+            "Total_Income": today_data.get("totalIncome"),
+        }
 
-                    return None
+        self_consumption = today_data.get("eselfConsumption")
+        if self_consumption is not None:
+            mapped["Self_Consumption"] = round(self_consumption * 100, 2)
 
-                result = await response.json()
+        self_sufficiency = today_data.get("eselfSufficiency")
+        if self_sufficiency is not None:
+            mapped["Self_Sufficiency"] = round(self_sufficiency * 100, 2)
 
-                _LOGGER.debug(f"Parsed battery data JSON: {result}")
+        carbon_kg = today_data.get("carbonNum")
+        if carbon_kg is not None:
+            mapped["CO2_Reduction_Tons"] = round(carbon_kg / 1000, 2)
 
-                if result.get("code") != 0 and result.get("code") != 200:
-                    _LOGGER.error(
-                        "Failed to get battery power data with code %s: %s",
-                        result.get("code"),
-                        result.get("msg")
-                    )
-                    return None
+        return mapped
 
-                power_data = result.get("data", {})
-                _LOGGER.debug("Received battery power data keys: %s", list(power_data.keys()) if power_data else None)
-                battery_data.update(power_data)
+    async def async_get_battery_data(self, station_id: str = None) -> Optional[Dict[str, Any]]:
+        """Get data for a specific battery using the new API endpoint.
 
-            stats_url = f"{self.base_url}/api/report/energy/getEnergyStatistics"
+        Results are cached for a short TTL per station so near-simultaneous
+        callers (multiple entities or coordinators) share one fetch instead
+        of each issuing the three-endpoint fan-out. A per-station lock makes
+        concurrent cache misses single-flight.
+        """
+        cache_key = station_id or ""
 
-            now = dt_util.now()
-            end_date = now.strftime("%Y-%m-%d")
-            begin_date = "2020-01-01"
+        cached = self._battery_cache.get(cache_key)
+        if cached and dt_util.utcnow() - cached[0] < BATTERY_DATA_TTL:
+            _LOGGER.debug("Returning cached battery data for station '%s'", cache_key)
+            return cached[1]
 
-            _LOGGER.debug("Fetching statistics for date range: %s to %s (current time: %s)",
-                         begin_date, end_date, now.strftime("%Y-%m-%d %H:%M:%S %Z"))
+        lock = self._battery_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            # Another caller may have populated the cache while we waited
+            cached = self._battery_cache.get(cache_key)
+            if cached and dt_util.utcnow() - cached[0] < BATTERY_DATA_TTL:
+                _LOGGER.debug("Returning cached battery data for station '%s'", cache_key)
+                return cached[1]
 
-            stats_params = {
-                "sysSn": "All",
-                "stationId": station_id or "",
-                "beginDate": begin_date,
-                "endDate": end_date
-            }
+            battery_data = await self._async_fetch_battery_data(station_id)
 
-            _LOGGER.info("Fetching energy statistics from: %s with params: %s", stats_url, stats_params)
-            async with asyncio.timeout(DEFAULT_TIMEOUT):
-                try:
-                    stats_response = await self.session.get(
-                        url=stats_url,
-                        params=stats_params,
-                        headers=headers
-                    )
-                except (asyncio.TimeoutError, aiohttp.ClientError) as stats_error:
-                    _LOGGER.error("Error fetching energy statistics: %s", stats_error)
-                    _LOGGER.debug("Returning only power data due to statistics fetch error")
-                    return battery_data
-
-                _LOGGER.debug(f"Energy statistics response status: {stats_response.status}")
-                stats_raw_text = await stats_response.text()
-                _LOGGER.debug(f"Energy statistics raw response: {stats_raw_text}")
-
-                if stats_response.status == 200:
-                    stats_result = await stats_response.json()
-                    _LOGGER.info("Energy statistics response JSON: %s", stats_result)
-
-                    if stats_result.get("code") == 200 or stats_result.get("code") == 0:
-                        stats_data = stats_result.get("data", {})
-                        _LOGGER.info("Energy statistics data fields: %s", list(stats_data.keys()) if stats_data else "No data")
-
-                        if stats_data:
-                            battery_data["Total_Solar_Generation"] = stats_data.get("epvT")
-                            battery_data["Total_Feed_In"] = stats_data.get("eout")
-                            battery_data["Total_Battery_Charge"] = stats_data.get("echarge")
-                            battery_data["PV_Power_House"] = stats_data.get("epv2load")
-                            battery_data["PV_Charging_Battery"] = stats_data.get("epvcharge")
-                            battery_data["Total_House_Consumption"] = stats_data.get("eload")
-                            battery_data["Grid_Based_Battery_Charge"] = stats_data.get("egridCharge")
-                            battery_data["Grid_Power_Consumption"] = stats_data.get("einput")
-                    else:
-                        _LOGGER.error(
-                            "Failed to get energy statistics with code %s: %s",
-                            stats_result.get("code"),
-                            stats_result.get("msg")
-                        )
-                else:
-                    _LOGGER.error(
-                        "Failed to get energy statistics with status %s",
-                        stats_response.status
-                    )
+            if battery_data is not None:
+                self._battery_cache[cache_key] = (dt_util.utcnow(), battery_data)
 
-            today_url = f"{self.base_url}/api/stable/home/getSumDataForCustomer"
-            today_date = now.strftime("%Y-%m-%d")
+            return battery_data
 
-            today_params = {
-                "sn": "All",
-                "stationId": station_id or "",
-                "tday": today_date
-            }
+    async def _async_fetch_battery_data(self, station_id: str = None) -> Optional[Dict[str, Any]]:
+        """Fetch and merge the three battery-data endpoints.
 
-            _LOGGER.info("Fetching today's stats from: %s with params: %s", today_url, today_params)
+        The three independent endpoints (power, lifetime statistics, today's
+        stats) are fetched concurrently so the poll takes roughly one
+        round-trip instead of three.
+        """
+        if not await self._ensure_token():
+            return None
 
+        # Format the timestamp once and slice the date out of it; strftime is
+        # surprisingly costly and this runs on every poll.
+        current_date = dt_util.now().strftime("%Y-%m-%d %H:%M:%S")
+        today_date = current_date[:10]
+
+        headers = self._get_auth_headers()
+        headers["operationDate"] = current_date
+
+        # One end-to-end deadline for the whole poll: without it, retries and
+        # per-request timeouts could stack well past what the coordinator
+        # expects before it schedules the next update.
+        try:
             async with asyncio.timeout(DEFAULT_TIMEOUT):
-                try:
-                    today_response = await self.session.get(
-                        url=today_url,
-                        params=today_params,
-                        headers=headers
-                    )
-                except (asyncio.TimeoutError, aiohttp.ClientError) as today_error:
-                    _LOGGER.error("Error fetching today's stats: %s", today_error)
-                    return battery_data
-
-                _LOGGER.debug(f"Today's stats response status: {today_response.status}")
-                today_raw_text = await today_response.text()
-                _LOGGER.debug(f"Today's stats raw response: {today_raw_text}")
-
-                if today_response.status == 200:
-                    today_result = await today_response.json()
-                    _LOGGER.info("Today's stats response JSON: %s", today_result)
-
-                    if today_result.get("code") == 200:
-                        today_data = today_result.get("data", {})
-                        _LOGGER.info("Today's stats data fields: %s", list(today_data.keys()) if today_data else "No data")
-
-                        if today_data:
-                            battery_data["PV_Generated_Today"] = today_data.get("epvtoday")
-                            battery_data["Total_PV_Generation"] = today_data.get("epvtotal")
-                            battery_data["Consumed_Today"] = today_data.get("eload")
-                            battery_data["Feed_In_Today"] = today_data.get("eoutput")
-                            battery_data["Grid_Import_Today"] = today_data.get("einput")
-                            battery_data["Battery_Charged_Today"] = today_data.get("echarge")
-                            battery_data["Battery_Discharged_Today"] = today_data.get("edischarge")
-
-                            self_consumption = today_data.get("eselfConsumption")
-                            if self_consumption is not None:
-                                battery_data["Self_Consumption"] = round(self_consumption * 100, 2)
-
-                            self_sufficiency = today_data.get("eselfSufficiency")
-                            if self_sufficiency is not None:
-                                battery_data["Self_Sufficiency"] = round(self_sufficiency * 100, 2)
-
-                            battery_data["Trees_Planted"] = today_data.get("treeNum")
-                            carbon_kg = today_data.get("carbonNum")
-                            if carbon_kg is not None:
-                                battery_data["CO2_Reduction_Tons"] = round(carbon_kg / 1000, 2)
-
-                            battery_data["Today_Income"] = today_data.get("todayIncome")
-                            battery_data["Total_Income"] = today_data.get("totalIncome")
-                    else:
-                        _LOGGER.error(
-                            "Failed to get today's stats with code %s: %s",
-                            today_result.get("code"),
-                            today_result.get("msg")
-                        )
-                else:
-                    _LOGGER.error(
-                        "Failed to get today's stats with status %s",
-                        today_response.status
-                    )
+                results = await asyncio.gather(
+                    self._bounded(self._fetch_power(station_id, headers)),
+                    self._bounded(self._fetch_stats(station_id, headers, STATS_BEGIN_DATE, today_date)),
+                    self._bounded(self._fetch_today(station_id, headers, today_date)),
+                    return_exceptions=True
+                )
+        except asyncio.TimeoutError:
+            _LOGGER.error("Battery data poll timed out after %ss", DEFAULT_TIMEOUT)
+            return None
+        power_data, stats_data, today_data = results
 
-            _LOGGER.debug("Combined battery data: %s", battery_data)
-            return battery_data
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error("Error fetching battery data: %s", result)
 
-        except (asyncio.TimeoutError, aiohttp.ClientError) as error:
-            _LOGGER.error("Error fetching battery data: %s", error)
+        # Without power data the poll is considered failed; the statistics
+        # endpoints only enrich the result.
+        if not isinstance(power_data, dict):
             return None
 
+        battery_data = {}
+        battery_data.update(power_data)
+        if isinstance(stats_data, dict):
+            battery_data.update(stats_data)
+        if isinstance(today_data, dict):
+            battery_data.update(today_data)
+
+        _LOGGER.debug("Combined battery data: %s", battery_data)
+        return battery_data
+
     def _get_auth_headers(self) -> Dict[str, str]:
-        """Get the authentication headers."""
-        return {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.token}"
-        }
+        """Get the static headers plus the current authentication token."""
+        return {**STATIC_API_HEADERS, "Authorization": f"Bearer {self.token}"}
+
+    def _get_settings_api(self):
+        """Return the shared BatterySettingsAPI, creating it on first use.
+
+        A single instance keeps the settings cache, single-flight future and
+        circuit-breaker state alive across calls.
+        """
+        if self._settings_api is None:
+            from .settings import BatterySettingsAPI
+
+            self._settings_api = BatterySettingsAPI(self)
+        return self._settings_api
 
     async def async_get_battery_settings(self):
         """Get current battery settings and cache them."""
         try:
-            from .settings import BatterySettingsAPI
-
-            settings_api = BatterySettingsAPI(self)
+            settings_api = self._get_settings_api()
             settings = await settings_api.fetch_current_settings()
 
             if settings:
@@ -442,9 +827,7 @@ class NeovoltClient:
                                             charge_cap: int = None) -> bool:
         """Update battery settings."""
         try:
-            from .settings import BatterySettingsAPI
-
-            settings_api = BatterySettingsAPI(self)
+            settings_api = self._get_settings_api()
 
             result = await settings_api.update_battery_settings(
                 discharge_start_time,
@@ -464,72 +847,55 @@ class NeovoltClient:
             _LOGGER.error("Error updating battery settings: %s", error)
             return False
 
-    async def _async_get(self, endpoint: str) -> Optional[Dict[str, Any]]:
-        """Make an async GET request."""
-        url = f"{self.base_url}/{endpoint}"
-        headers = self._get_auth_headers()
+    async def _async_endpoint_request(
+        self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Make an authenticated request to an API endpoint.
 
-        try:
-            async with self.session.get(url, headers=headers, timeout=DEFAULT_TIMEOUT) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    _LOGGER.error("GET request failed with status %s", response.status)
-                    return None
-        except Exception as error:
-            _LOGGER.error("Error making GET request: %s", error)
+        Single code path for GET/POST/PUT so the 401 re-login, retry/backoff
+        and logging cannot drift apart between methods.
+        """
+        if not await self._ensure_token():
             return None
 
-    async def _async_post(self, endpoint: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Make an async POST request."""
         url = f"{self.base_url}/{endpoint}"
         headers = self._get_auth_headers()
-        headers.update({
-            "Accept": "application/json, text/plain, */*",
-            "Content-Type": "application/json",
-            "language": "en-US",
-            "platform": "AK9D8H",
-            "System": "alphacloud"
-        })
+        description = f"{method} request"
 
-        try:
-            async with self.session.post(url, headers=headers, json=data, timeout=DEFAULT_TIMEOUT) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    _LOGGER.error("POST request failed with status %s for URL %s", response.status, url)
-                    _LOGGER.error("Request headers: %s", headers)
-                    _LOGGER.error("Request data: %s", data)
-                    response_text = await response.text()
-                    _LOGGER.error("Response text: %s", response_text)
+        for attempt in range(2):
+            fetched = await self._async_request(
+                method, url, json_data=data, headers=headers, description=description
+            )
+            if fetched is None:
+                return None
+
+            status, result, raw_text = fetched
+            if status == 200:
+                return result
+
+            if status == 401 and attempt == 0:
+                _LOGGER.debug("%s returned 401, refreshing token", description)
+                if not await self.async_login():
                     return None
-        except Exception as error:
-            _LOGGER.error("Error making POST request: %s", error)
+                headers["Authorization"] = f"Bearer {self.token}"
+                continue
+
+            _LOGGER.error("%s failed with status %s for URL %s", description, status, url)
+            if data is not None:
+                _LOGGER.error("Request data: %s", data)
+            _LOGGER.error("Response text: %s", raw_text)
             return None
 
+        return None
+
+    async def _async_get(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Make an async GET request."""
+        return await self._async_endpoint_request("GET", endpoint)
+
+    async def _async_post(self, endpoint: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Make an async POST request."""
+        return await self._async_endpoint_request("POST", endpoint, data)
+
     async def _async_put(self, endpoint: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Make an async PUT request."""
-        url = f"{self.base_url}/{endpoint}"
-        headers = self._get_auth_headers()
-        headers.update({
-            "Accept": "application/json, text/plain, */*",
-            "Content-Type": "application/json",
-            "language": "en-US",
-            "platform": "AK9D8H",
-            "System": "alphacloud"
-        })
-
-        try:
-            async with self.session.put(url, headers=headers, json=data, timeout=DEFAULT_TIMEOUT) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    _LOGGER.error("PUT request failed with status %s for URL %s", response.status, url)
-                    _LOGGER.error("Request headers: %s", headers)
-                    _LOGGER.error("Request data: %s", data)
-                    response_text = await response.text()
-                    _LOGGER.error("Response text: %s", response_text)
-                    return None
-        except Exception as error:
-            _LOGGER.error("Error making PUT request: %s", error)
-            return None
+        return await self._async_endpoint_request("PUT", endpoint, data)
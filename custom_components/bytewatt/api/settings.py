@@ -1,17 +1,58 @@
 """Battery settings API interface for Byte-Watt integration."""
 import asyncio
+import copy
 import logging
+import random
 import time
-from typing import Optional, Dict, Any, Tuple
+from enum import Enum
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
+from ..const import (
+    CONF_SETTINGS_MAX_RETRIES,
+    CONF_SETTINGS_PARTIAL_PUT,
+    CONF_SETTINGS_RETRY_DELAY,
+    DEFAULT_SETTINGS_MAX_RETRIES,
+    DEFAULT_SETTINGS_PARTIAL_PUT,
+    DEFAULT_SETTINGS_RETRY_DELAY,
+)
 from ..models import BatterySettings
 from ..utilities.time_utils import sanitize_time_format
-from typing import TYPE_CHECKING
+
 if TYPE_CHECKING:
     from .neovolt_client import NeovoltClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Retry backoff tuning
+BACKOFF_CAP = 30.0
+BACKOFF_JITTER = 0.5
+
+# How long a fetched BatterySettings stays fresh enough to reuse
+SETTINGS_CACHE_TTL = 15.0
+
+# Past this age the cache is no longer served stale; refetch inline
+SETTINGS_CACHE_HARD_TTL = 120.0
+
+# Total sleep budget across one call's retries
+MAX_RETRY_WAIT = 30.0
+
+# Response codes that won't improve with retrying (auth/permission/route)
+UNRECOVERABLE_CODES = {401, 403, 404}
+
+# Consecutive failed call batches before the settings circuit opens
+CIRCUIT_FAILURE_THRESHOLD = 3
+
+# How long the circuit stays open once tripped
+CIRCUIT_OPEN_SECONDS = 60.0
+
+
+class RetryVerdict(Enum):
+    """Classifier verdicts for _retry."""
+    SUCCESS = "success"
+    RETRY = "retry"
+    RETRY_SLOW = "retry_slow"  # retry with a doubled backoff base
+    FATAL = "fatal"
+
 
 class BatterySettingsAPI:
     """API client for battery settings."""
@@ -19,11 +60,114 @@ class BatterySettingsAPI:
     def __init__(self, api_client: 'NeovoltClient'):
         """Initialize the battery settings API client."""
         self.api_client = api_client
-        
+
+        # Retry defaults, overridable through the integration options
+        options = getattr(api_client, "options", None) or {}
+        self._default_retries: int = options.get(
+            CONF_SETTINGS_MAX_RETRIES, DEFAULT_SETTINGS_MAX_RETRIES
+        )
+        self._default_base_delay: float = options.get(
+            CONF_SETTINGS_RETRY_DELAY, DEFAULT_SETTINGS_RETRY_DELAY
+        )
+        # Delta PUT bodies are opt-in: the documented endpoint takes the
+        # full object, and a replace-semantics server answers a partial
+        # body with the same success response while zeroing omitted fields
+        self._partial_put_enabled: bool = bool(options.get(
+            CONF_SETTINGS_PARTIAL_PUT, DEFAULT_SETTINGS_PARTIAL_PUT
+        ))
+
+
         # Default settings cache (used only if API fetch fails)
         self._settings_cache = BatterySettings()
         self._settings_loaded = False
-    
+        # Monotonic timestamp of the last successful fetch or write
+        self._settings_cache_ts = 0.0
+        self._settings_ttl = SETTINGS_CACHE_TTL
+        self._settings_hard_ttl = SETTINGS_CACHE_HARD_TTL
+        # In-flight fetch shared by concurrent callers (single-flight)
+        self._fetch_inflight: Optional[asyncio.Future] = None
+        # Strong reference to the background revalidation task; the event
+        # loop only keeps weak ones, so an unreferenced task can be
+        # garbage-collected mid-flight
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Whether the server accepts delta PUT bodies; None until the first
+        # partial update is attempted and the response settles the question
+        self._support_partial_put: Optional[bool] = None
+        # Lightweight circuit breaker: consecutive failed call batches trip
+        # it open so outages fast-fail instead of burning the retry budget
+        self._failure_streak = 0
+        self._circuit_open_until = 0.0
+
+    def _circuit_open(self) -> bool:
+        """Return True while the circuit is open after repeated failures."""
+        return time.monotonic() < self._circuit_open_until
+
+    def _record_call_result(self, success: bool) -> None:
+        """Track call batches and trip the circuit on repeated failures."""
+        if success:
+            self._failure_streak = 0
+            return
+        self._failure_streak += 1
+        if self._failure_streak >= CIRCUIT_FAILURE_THRESHOLD:
+            self._circuit_open_until = time.monotonic() + CIRCUIT_OPEN_SECONDS
+            _LOGGER.warning(
+                "Settings API circuit opened for %.0fs after %d consecutive failed calls",
+                CIRCUIT_OPEN_SECONDS, self._failure_streak,
+            )
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        """Release the background refresh reference and surface its errors."""
+        if self._refresh_task is task:
+            self._refresh_task = None
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.warning("Background settings refresh failed: %s", task.exception())
+
+    def _settings_fresh(self) -> bool:
+        """Return True if the cached settings are recent enough to reuse."""
+        return (
+            self._settings_loaded
+            and (time.monotonic() - self._settings_cache_ts) < self._settings_ttl
+        )
+
+    @staticmethod
+    def _backoff_delay(attempt: int, base: float = 1.0, cap: float = BACKOFF_CAP,
+                       jitter: float = BACKOFF_JITTER) -> float:
+        """Return the backoff delay for a retry attempt, with jitter.
+
+        Jitter desynchronizes retries across installations so a struggling
+        server isn't hit by aligned waves of requests.
+        """
+        return min(cap, base * (2 ** attempt)) * (1 + random.uniform(-jitter, jitter))
+
+    async def _retry(self, do_call, classify, max_retries: int, base_delay: float,
+                     max_wait: float = MAX_RETRY_WAIT):
+        """Run do_call under the shared retry policy.
+
+        classify(response, attempt) maps each response to a RetryVerdict:
+        SUCCESS returns the response, FATAL aborts immediately, and the RETRY
+        verdicts sleep with capped exponential backoff (RETRY_SLOW from a
+        doubled base) until the attempt count or wait budget runs out.
+
+        Returns the successful response, or None.
+        """
+        cumulative_wait = 0.0
+        for attempt in range(max_retries):
+            response = await do_call()
+            verdict = classify(response, attempt)
+            if verdict is RetryVerdict.SUCCESS:
+                return response
+            if verdict is RetryVerdict.FATAL:
+                return None
+            if attempt < max_retries - 1:
+                base = base_delay * 2 if verdict is RetryVerdict.RETRY_SLOW else base_delay
+                delay = self._backoff_delay(attempt, base=base)
+                if cumulative_wait + delay > max_wait:
+                    _LOGGER.warning("Retry wait budget exhausted")
+                    return None
+                cumulative_wait += delay
+                await asyncio.sleep(delay)
+        return None
+
     def validate_settings_input(self, 
                               discharge_start_time, 
                               discharge_end_time, 
@@ -51,77 +195,113 @@ class BatterySettingsAPI:
         discharge_end = sanitize_time_format(discharge_end_time)
         charge_start = sanitize_time_format(charge_start_time)
         charge_end = sanitize_time_format(charge_end_time)
-        
-        # Validate minimum SOC
-        min_soc = None
-        if minimum_soc is not None:
-            try:
-                min_soc_val = int(minimum_soc)
-                if 1 <= min_soc_val <= 100:
-                    min_soc = min_soc_val
-                else:
-                    _LOGGER.error(f"Minimum SOC must be between 1 and 100, got {minimum_soc}")
-            except (ValueError, TypeError):
-                _LOGGER.error(f"Invalid minimum SOC value: {minimum_soc}")
-        
-        # Validate charge cap
-        max_charge_cap = None
-        if charge_cap is not None:
-            try:
-                charge_cap_val = int(charge_cap)
-                if 1 <= charge_cap_val <= 100:
-                    max_charge_cap = charge_cap_val
-                else:
-                    _LOGGER.error(f"Charge cap must be between 1 and 100, got {charge_cap}")
-            except (ValueError, TypeError):
-                _LOGGER.error(f"Invalid charge cap value: {charge_cap}")
-        
+
+        min_soc = self._validate_percent(minimum_soc, "Minimum SOC")
+        max_charge_cap = self._validate_percent(charge_cap, "Charge cap")
+
         return discharge_start, discharge_end, charge_start, charge_end, min_soc, max_charge_cap
+
+    @staticmethod
+    def _validate_percent(value, name: str) -> Optional[int]:
+        """Validate a 1-100 percentage value, returning int or None."""
+        if value is None:
+            return None
+        try:
+            percent = int(value)
+        except (ValueError, TypeError):
+            _LOGGER.error("Invalid %s value: %s", name, value)
+            return None
+        if 1 <= percent <= 100:
+            return percent
+        _LOGGER.error("%s must be between 1 and 100, got %s", name, value)
+        return None
     
-    async def fetch_current_settings(self, max_retries: int = 3, retry_delay: int = 1) -> Optional[BatterySettings]:
+    async def fetch_current_settings(self, max_retries: Optional[int] = None,
+                                     retry_delay: Optional[float] = None) -> Optional[BatterySettings]:
         """
         Fetch current battery settings directly from the API using new endpoint.
-        
+
         Args:
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
-            
+            max_retries: Maximum number of retry attempts (configured default if None)
+            retry_delay: Base delay between retries in seconds (configured default if None)
+
         Returns:
             BatterySettings if successful, None if failed
         """
+        if self._circuit_open():
+            _LOGGER.debug("Settings circuit open, fast-failing fetch")
+            return None
+
+        if max_retries is None:
+            max_retries = self._default_retries
+        if retry_delay is None:
+            retry_delay = self._default_base_delay
+
+        # Single-flight: if a fetch is already running (HA reconciliation can
+        # fire sync and update together), await its result instead of issuing
+        # a duplicate GET
+        inflight = self._fetch_inflight
+        if inflight is not None and not inflight.done():
+            return await inflight
+
+        self._fetch_inflight = future = asyncio.get_running_loop().create_future()
+        try:
+            settings = await self._do_fetch_current_settings(max_retries, retry_delay)
+        except BaseException as err:
+            future.set_exception(err)
+            future.exception()  # mark retrieved in case nobody else awaits it
+            raise
+        else:
+            future.set_result(settings)
+            return settings
+        finally:
+            self._fetch_inflight = None
+
+    async def _do_fetch_current_settings(self, max_retries: int,
+                                         retry_delay: float) -> Optional[BatterySettings]:
+        """Run the actual settings GET with retries."""
         # Use new API endpoint with empty id= to get settings for all devices
         endpoint = "api/iterate/sysSet/getChargeConfigInfo?id="
-        
-        for attempt in range(max_retries):
-            response = await self.api_client._async_get(endpoint)
-            
+
+        def classify(response, attempt):
             if not response:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                continue
-                
-            if "data" not in response or "code" not in response or response["code"] != 200:
-                _LOGGER.error(f"Unexpected response format (attempt {attempt+1}/{max_retries}): {response}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                continue
-                
-            # Success! Extract the settings
+                return RetryVerdict.RETRY
+            code = response.get("code")
+            if code != 200 or response.get("data") is None:
+                if code in UNRECOVERABLE_CODES:
+                    # Auth or routing failures won't fix themselves here;
+                    # fall straight through to the cached/default fallback
+                    _LOGGER.error("Unrecoverable response fetching settings (code %s), not retrying", code)
+                    return RetryVerdict.FATAL
+                _LOGGER.error("Unexpected response format (attempt %d/%d): %s", attempt + 1, max_retries, response)
+                return RetryVerdict.RETRY
+            return RetryVerdict.SUCCESS
+
+        response = await self._retry(
+            lambda: self.api_client._async_get(endpoint),
+            classify, max_retries, retry_delay,
+        )
+
+        self._record_call_result(response is not None)
+
+        if response is not None:
             settings = BatterySettings.from_api_response(response["data"])
-            
+
             # Update our settings cache
             self._settings_cache = settings
             self._settings_loaded = True
-            
-            _LOGGER.info(f"Successfully fetched current settings from new API")
-            _LOGGER.debug(f"Current settings: " +
-                         f"Charge: {settings.time_chaf1a}-{settings.time_chae1a}, " +
-                         f"Discharge: {settings.time_disf1a}-{settings.time_dise1a}, " +
-                         f"Min SOC: {settings.bat_use_cap}%")
-            
+            self._settings_cache_ts = time.monotonic()
+
+            _LOGGER.info("Successfully fetched current settings from new API")
+            _LOGGER.debug(
+                "Current settings: Charge: %s-%s, Discharge: %s-%s, Min SOC: %s%%",
+                settings.time_chaf1a, settings.time_chae1a,
+                settings.time_disf1a, settings.time_dise1a, settings.bat_use_cap,
+            )
+
             return settings
-        
-        _LOGGER.error(f"Failed to fetch current settings after {max_retries} attempts")
+
+        _LOGGER.error("Failed to fetch current settings after %d attempts", max_retries)
         # If we failed to fetch from API, use the cached settings or defaults
         if self._settings_loaded:
             _LOGGER.warning("Using cached settings as fallback")
@@ -130,17 +310,35 @@ class BatterySettingsAPI:
             _LOGGER.warning("Using default settings as fallback")
             return self._settings_cache
     
-    async def get_current_settings(self, max_retries: int = 3, retry_delay: int = 1) -> BatterySettings:
+    async def get_current_settings(self, max_retries: Optional[int] = None,
+                                   retry_delay: Optional[float] = None) -> BatterySettings:
         """
         Get current battery settings - first try API, then fallback to cache.
-        
+
         Args:
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
-            
+            max_retries: Maximum number of retry attempts (configured default if None)
+            retry_delay: Base delay between retries in seconds (configured default if None)
+
         Returns:
             Current battery settings
         """
+        # Serve from cache while fresh; back-to-back updates (e.g. grid
+        # charge toggles) then skip the extra GET round-trip
+        if self._settings_fresh():
+            return self._settings_cache
+
+        # Stale but serviceable: return the cache now and revalidate in the
+        # background so callers like sync_grid_charge_to_ha never block on
+        # the GET (the single-flight future dedupes concurrent refreshes)
+        if (self._settings_loaded
+                and (time.monotonic() - self._settings_cache_ts) < self._settings_hard_ttl):
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(
+                    self.fetch_current_settings(max_retries, retry_delay)
+                )
+                self._refresh_task.add_done_callback(self._refresh_done)
+            return self._settings_cache
+
         # First try to fetch from API
         settings = await self.fetch_current_settings(max_retries, retry_delay)
         
@@ -164,8 +362,8 @@ class BatterySettingsAPI:
                               minimum_soc=None,
                               charge_cap=None,
                               grid_charge: Optional[int] = None,
-                              max_retries: int = 5, 
-                              retry_delay: int = 1) -> bool:
+                              max_retries: Optional[int] = None,
+                              retry_delay: Optional[float] = None) -> bool:
         """
         Update battery settings with API fetch to preserve existing settings.
         
@@ -177,9 +375,9 @@ class BatterySettingsAPI:
             minimum_soc: Minimum state of charge percentage to maintain (1-100)
             charge_cap: Maximum charge cap percentage (1-100)
             grid_charge: Enable or disable grid charging (1 or 0)
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
-            
+            max_retries: Maximum number of retry attempts (configured default if None)
+            retry_delay: Base delay between retries in seconds (configured default if None)
+
         Returns:
             True if successful, False otherwise
         """
@@ -196,111 +394,194 @@ class BatterySettingsAPI:
         
         # Get current settings from the API - this will fetch from API or use cache as fallback
         current_settings = await self.get_current_settings()
-        
-        # Create a copy of the current settings
-        settings = current_settings
+
+        # Work on a copy so we can diff the result against what the API
+        # reported and so a failed PUT can't leave unsent values in the
+        # cache; additional_fields is a dict, so detach it from the original
+        settings = copy.copy(current_settings)
+        settings.additional_fields = dict(current_settings.additional_fields)
         
         # Update settings with provided values (only if they're valid)
         if discharge_start is not None:
             settings.time_disf1a = discharge_start
-            _LOGGER.debug(f"Updating discharge start time to {discharge_start}")
+            _LOGGER.debug("Updating discharge start time to %s", discharge_start)
         
         if discharge_end is not None:
             settings.time_dise1a = discharge_end
-            _LOGGER.debug(f"Updating discharge end time to {discharge_end}")
+            _LOGGER.debug("Updating discharge end time to %s", discharge_end)
         
         if charge_start is not None:
             settings.time_chaf1a = charge_start
-            _LOGGER.debug(f"Updating charge start time to {charge_start}")
+            _LOGGER.debug("Updating charge start time to %s", charge_start)
         
         if charge_end is not None:
             settings.time_chae1a = charge_end
-            _LOGGER.debug(f"Updating charge end time to {charge_end}")
+            _LOGGER.debug("Updating charge end time to %s", charge_end)
         
         if min_soc is not None:
             settings.bat_use_cap = min_soc
-            _LOGGER.debug(f"Updating minimum SOC to {min_soc}%")
+            _LOGGER.debug("Updating minimum SOC to %s%%", min_soc)
         
         if max_charge_cap is not None:
             settings.bat_high_cap = str(max_charge_cap)
-            _LOGGER.debug(f"Updating charge cap to {max_charge_cap}%")
+            _LOGGER.debug("Updating charge cap to %s%%", max_charge_cap)
         
         if grid_charge is not None:
             settings.grid_charge = grid_charge
-            _LOGGER.debug(f"Updating grid charge flag to {grid_charge}")
-        
+            _LOGGER.debug("Updating grid charge flag to %s", grid_charge)
+
+        # Skip the round trip when the requested values already match the
+        # server state (e.g. HA reconciling a grid_charge that didn't
+        # change) — but only against a fresh baseline. A stale cache could
+        # hide an external change made from the vendor app, and skipping
+        # on it would silently drop a genuine write
+        if self._settings_fresh() and all(
+            getattr(settings, attr) == getattr(current_settings, attr)
+            for attr in ("time_disf1a", "time_dise1a", "time_chaf1a", "time_chae1a",
+                         "bat_use_cap", "bat_high_cap", "grid_charge")
+        ):
+            _LOGGER.debug("Battery settings already match requested values, skipping update")
+            return True
+
         # Send the updated settings to the server
-        return await self._send_battery_settings(settings, max_retries, retry_delay)
+        return await self._send_battery_settings(settings, max_retries, retry_delay,
+                                                 previous=current_settings)
     
-    async def _send_battery_settings(self, 
-                              settings: BatterySettings, 
-                              max_retries: int = 5, 
-                              retry_delay: int = 1) -> bool:
+    @staticmethod
+    def _settings_delta(previous: BatterySettings,
+                        payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return only the payload keys that differ from previous settings.
+
+        The device id is kept so the server can route the update. Returns
+        None when a delta body would bring no saving over the full payload.
+        """
+        previous_payload = previous.to_dict()
+        delta = {
+            key: value for key, value in payload.items()
+            if key not in previous_payload or previous_payload[key] != value
+        }
+        if not delta or len(delta) >= len(payload):
+            return None
+        delta["id"] = payload["id"]
+        return delta
+
+    def _commit_sent_settings(self, settings: BatterySettings) -> None:
+        """Record a successful write as the new cached server state."""
+        self._settings_cache = settings
+        self._settings_loaded = True
+        self._settings_cache_ts = time.monotonic()
+        _LOGGER.info(
+            "Updated settings: Charge: %s-%s, Discharge: %s-%s, Min SOC: %s%%",
+            settings.time_chaf1a, settings.time_chae1a,
+            settings.time_disf1a, settings.time_dise1a, settings.bat_use_cap,
+        )
+
+    async def _send_battery_settings(self,
+                              settings: BatterySettings,
+                              max_retries: Optional[int] = None,
+                              retry_delay: Optional[float] = None,
+                              previous: Optional[BatterySettings] = None) -> bool:
         """
         Internal method to send battery settings to the server.
-        
+
         Args:
             settings: Battery settings to send
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
-            
+            max_retries: Maximum number of retry attempts (configured default if None)
+            retry_delay: Base delay between retries in seconds (configured default if None)
+            previous: Server-state settings to diff against for a delta PUT
+
         Returns:
             True if successful, False otherwise
         """
+        if self._circuit_open():
+            _LOGGER.debug("Settings circuit open, fast-failing update")
+            return False
+
+        if max_retries is None:
+            max_retries = self._default_retries
+        if retry_delay is None:
+            retry_delay = self._default_base_delay
+
         endpoint = "api/iterate/sysSet/updateChargeConfigInfo"
-        
-        for attempt in range(max_retries):
-            response = await self.api_client._async_put(endpoint, settings.to_dict())
-            
+
+        # The full payload doesn't change between attempts, so build it once
+        payload = settings.to_dict()
+
+        # Try a delta body first when the user has opted in and we know what
+        # the server already has: only the changed keys (plus id) go over
+        # the wire. Any failure falls through to the full-payload retry
+        # loop, and an explicit rejection latches _support_partial_put so
+        # it only ever costs one extra request for this client's lifetime
+        if (previous is not None and self._partial_put_enabled
+                and self._support_partial_put is not False):
+            delta = self._settings_delta(previous, payload)
+            if delta is not None:
+                response = await self.api_client._async_put(endpoint, delta)
+                accepted = (bool(response) and response.get("code") == 200
+                            and response.get("msg") == "Success")
+                # Only an actual server reply settles the question; a None
+                # response is a timeout/network failure, not a rejection
+                if response and self._support_partial_put is None:
+                    self._support_partial_put = accepted
+                    _LOGGER.debug("Partial settings updates %s by server",
+                                  "accepted" if accepted else "rejected")
+                if accepted:
+                    _LOGGER.info("Successfully updated battery settings (delta of %d fields)",
+                                 len(delta))
+                    self._record_call_result(True)
+                    self._commit_sent_settings(settings)
+                    return True
+                _LOGGER.debug("Delta settings update failed, retrying with full payload")
+
+        def classify(response, attempt):
             if not response:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                continue
-                
+                return RetryVerdict.RETRY
             # Check for successful response based on new API format
-            if response.get("code") == 200 and response.get("msg") == "Success":
-                _LOGGER.info(f"Successfully updated battery settings using new API")
-                # Update settings cache with the successfully sent settings
-                self._settings_cache = settings
-                self._settings_loaded = True
-                
-                # Log the updated settings
-                _LOGGER.info(f"Updated settings: " +
-                            f"Charge: {settings.time_chaf1a}-{settings.time_chae1a}, " +
-                            f"Discharge: {settings.time_disf1a}-{settings.time_dise1a}, " +
-                            f"Min SOC: {settings.bat_use_cap}%")
-                return True
-            elif response.get("code") == 9007:
-                _LOGGER.warning(f"Network exception from server (attempt {attempt+1}/{max_retries}): {response.get('msg', 'Unknown error')}")
-                # Server is reporting a network issue, let's retry
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                continue
-            else:
-                _LOGGER.error(f"Unexpected response when setting battery parameters: {response}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                continue
-        
-        _LOGGER.error(f"Failed to update battery settings after {max_retries} attempts")
+            code = response.get("code")
+            if code == 200 and response.get("msg") == "Success":
+                return RetryVerdict.SUCCESS
+            if code == 9007:
+                # Server is reporting a network issue; back off harder so it
+                # has room to recover before we retry
+                _LOGGER.warning("Network exception from server (attempt %d/%d): %s",
+                                attempt + 1, max_retries, response.get("msg", "Unknown error"))
+                return RetryVerdict.RETRY_SLOW
+            _LOGGER.error("Unexpected response when setting battery parameters: %s", response)
+            return RetryVerdict.RETRY
+
+        response = await self._retry(
+            lambda: self.api_client._async_put(endpoint, payload),
+            classify, max_retries, retry_delay,
+        )
+
+        self._record_call_result(response is not None)
+
+        if response is not None:
+            _LOGGER.info("Successfully updated battery settings using new API")
+            # The write confirms server state, so refresh the cache TTL too
+            self._commit_sent_settings(settings)
+            return True
+
+        _LOGGER.error("Failed to update battery settings after %d attempts", max_retries)
         return False
     
-    async def set_battery_settings(self, end_discharge="23:00", max_retries: int = 5, retry_delay: int = 1) -> bool:
+    async def set_battery_settings(self, end_discharge="23:00", max_retries: Optional[int] = None,
+                                   retry_delay: Optional[float] = None) -> bool:
         """
         Legacy method for backward compatibility - updates only the discharge end time.
-        
+
         Args:
             end_discharge: Time to end battery discharge (format HH:MM)
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
-            
+            max_retries: Maximum number of retry attempts (configured default if None)
+            retry_delay: Base delay between retries in seconds (configured default if None)
+
         Returns:
             True if successful, False otherwise
         """
         # Sanitize the time format
         sanitized_end_discharge = sanitize_time_format(end_discharge)
         if not sanitized_end_discharge:
-            _LOGGER.error(f"Invalid end discharge time format: {end_discharge}")
+            _LOGGER.error("Invalid end discharge time format: %s", end_discharge)
             return False
             
         return await self.update_battery_settings(
@@ -317,11 +598,19 @@ class BatterySettingsAPI:
         Args:
             hass: Home Assistant core instance
         """
+        # Grab the HA side before awaiting the network: states.get is an
+        # in-memory lookup, so reading it up front keeps the reconciliation
+        # inputs gathered while the settings fetch (if any) is in flight
+        existing = hass.states.get("input_boolean.bytewatt_enable_grid_charging")
         settings = await self.get_current_settings()
         if settings:
             is_enabled = settings.grid_charge == 1
             state = "on" if is_enabled else "off"
-            _LOGGER.debug(f"Syncing input_boolean.bytewatt_enable_grid_charging to '{state}'")
+            # Setting an unchanged state still broadcasts a state-changed
+            # event to every listener on the bus, so skip the no-op write
+            if existing is not None and existing.state == state:
+                return
+            _LOGGER.debug("Syncing input_boolean.bytewatt_enable_grid_charging to '%s'", state)
             hass.states.async_set("input_boolean.bytewatt_enable_grid_charging", state)
     
     # ======== New helper to update grid_charge from HA input_boolean ========
@@ -336,5 +625,5 @@ class BatterySettingsAPI:
             True if API update succeeded, False otherwise
         """
         grid_charge_value = 1 if enabled else 0
-        _LOGGER.debug(f"Updating grid_charge to {grid_charge_value} from HA input_boolean toggle")
+        _LOGGER.debug("Updating grid_charge to %s from HA input_boolean toggle", grid_charge_value)
         return await self.update_battery_settings(grid_charge=grid_charge_value)
@@ -1,7 +1,5 @@
 """Client for interacting with the Byte-Watt API."""
 import logging
-from typing import Dict, Any, Optional, List
-import asyncio
 
 from homeassistant.core import HomeAssistant
 
@@ -11,41 +9,31 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class ByteWattClient:
-    """Client for interacting with the Byte-Watt API."""
-    
+    """Client for interacting with the Byte-Watt API.
+
+    Thin facade over NeovoltClient kept for its established public names;
+    calls are forwarded by binding the underlying method directly, so the
+    old per-call pass-through stack frame is gone.
+    """
+
+    # Public names whose NeovoltClient counterparts are spelled differently
+    _FORWARDED = {
+        "get_battery_data": "async_get_battery_data",
+        "get_device_list": "async_get_device_list",
+        "update_battery_settings": "async_update_battery_settings",
+    }
+
     def __init__(self, hass: HomeAssistant, username: str, password: str):
         """Initialize with login credentials."""
         self.hass = hass
         self.username = username
         self.password = password
         self.api_client = NeovoltClient(hass, username, password)
-        self._settings_cache = {}
-    
+
     async def initialize(self) -> bool:
         """Initialize or re-initialize the client."""
         return await self.api_client.async_login()
-    
-    async def get_battery_data(self, station_id: str = None) -> Optional[Dict[str, Any]]:
-        """Get battery data from the API."""
-        return await self.api_client.async_get_battery_data(station_id)
-    
-    async def get_device_list(self) -> Optional[Dict[str, Any]]:
-        """Get list of devices from the API."""
-        return await self.api_client.async_get_device_list()
-    
-    async def update_battery_settings(self, 
-                                    discharge_start_time: str = None,
-                                    discharge_end_time: str = None,
-                                    charge_start_time: str = None,
-                                    charge_end_time: str = None,
-                                    minimum_soc: int = None,
-                                    charge_cap: int = None) -> bool:
-        """Update battery settings."""
-        return await self.api_client.async_update_battery_settings(
-            discharge_start_time=discharge_start_time,
-            discharge_end_time=discharge_end_time,
-            charge_start_time=charge_start_time,
-            charge_end_time=charge_end_time,
-            minimum_soc=minimum_soc,
-            charge_cap=charge_cap
-        )
+
+    def __getattr__(self, name):
+        """Forward everything else straight to the underlying NeovoltClient."""
+        return getattr(self.api_client, self._FORWARDED.get(name, name))
@@ -12,7 +12,13 @@ from .const import (
     CONF_USERNAME, 
     CONF_PASSWORD,
     CONF_SCAN_INTERVAL,
+    CONF_SETTINGS_MAX_RETRIES,
+    CONF_SETTINGS_PARTIAL_PUT,
+    CONF_SETTINGS_RETRY_DELAY,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SETTINGS_MAX_RETRIES,
+    DEFAULT_SETTINGS_PARTIAL_PUT,
+    DEFAULT_SETTINGS_RETRY_DELAY,
     MIN_SCAN_INTERVAL
 )
 
@@ -85,6 +91,24 @@ class ByteWattOptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                         ),
                     ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)),
+                    vol.Optional(
+                        CONF_SETTINGS_MAX_RETRIES,
+                        default=self.config_entry.options.get(
+                            CONF_SETTINGS_MAX_RETRIES, DEFAULT_SETTINGS_MAX_RETRIES
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+                    vol.Optional(
+                        CONF_SETTINGS_RETRY_DELAY,
+                        default=self.config_entry.options.get(
+                            CONF_SETTINGS_RETRY_DELAY, DEFAULT_SETTINGS_RETRY_DELAY
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=30)),
+                    vol.Optional(
+                        CONF_SETTINGS_PARTIAL_PUT,
+                        default=self.config_entry.options.get(
+                            CONF_SETTINGS_PARTIAL_PUT, DEFAULT_SETTINGS_PARTIAL_PUT
+                        ),
+                    ): bool,
                 }
             ),
         )
\ No newline at end of file
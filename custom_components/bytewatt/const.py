@@ -13,6 +13,9 @@ CONF_STALE_CHECKS_THRESHOLD = "stale_checks_threshold"
 CONF_NOTIFY_ON_RECOVERY = "notify_on_recovery"
 CONF_DIAGNOSTICS_MODE = "diagnostics_mode"
 CONF_AUTO_RECONNECT_TIME = "auto_reconnect_time"
+CONF_SETTINGS_MAX_RETRIES = "settings_max_retries"
+CONF_SETTINGS_RETRY_DELAY = "settings_retry_base_delay"
+CONF_SETTINGS_PARTIAL_PUT = "settings_partial_put"
 
 # Defaults
 DEFAULT_SCAN_INTERVAL = 60  # 1 minute
@@ -24,6 +27,9 @@ DEFAULT_STALE_CHECKS_THRESHOLD = 3
 DEFAULT_NOTIFY_ON_RECOVERY = True
 DEFAULT_DIAGNOSTICS_MODE = False
 DEFAULT_AUTO_RECONNECT_TIME = "03:30:00"  # 3:30 AM
+DEFAULT_SETTINGS_MAX_RETRIES = 5
+DEFAULT_SETTINGS_RETRY_DELAY = 1.0  # seconds, base for exponential backoff
+DEFAULT_SETTINGS_PARTIAL_PUT = False  # full-object updates unless explicitly enabled
 
 # Services
 SERVICE_SET_DISCHARGE_TIME = "set_discharge_time"  # Legacy service
@@ -37,6 +43,9 @@ SERVICE_FORCE_RECONNECT = "force_reconnect"  # Force client reconnection for tro
 SERVICE_HEALTH_CHECK = "health_check"  # Check connection health and return diagnostics
 SERVICE_TOGGLE_DIAGNOSTICS = "toggle_diagnostics"  # Toggle diagnostic logging
 
+# Dispatcher signals (suffixed with the config entry id at runtime)
+SIGNAL_SUCCESSFUL_UPDATE = "bytewatt_successful_update"
+
 # Service attributes
 ATTR_END_DISCHARGE = "end_discharge"
 ATTR_START_DISCHARGE = "start_discharge"
@@ -12,6 +12,7 @@ from typing import Dict, Any, List, Optional, Set
 import voluptuous as vol
 from homeassistant.components.persistent_notification import async_create, async_dismiss
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
@@ -36,6 +37,7 @@ from .const import (
     STALE_DATA_THRESHOLD,
     AUTO_RECONNECT_INTERVAL_HOURS,
     HTTPS_PORT,
+    SIGNAL_SUCCESSFUL_UPDATE,
 )
 from .utilities.circuit_breaker import CircuitBreaker, CircuitBreakerState
 from .utilities.connection_stats import ConnectionStatistics
@@ -65,7 +67,12 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
         self.entry_id = entry_id
         self._last_battery_data = None
         self._scan_interval = scan_interval
+        # Keys present in the current battery dict; rebuilt once per update
+        # by the sensor platform so entity availability checks share it
+        self._available_keys: frozenset = frozenset()
         self._last_successful_update: Optional[datetime] = None
+        # isoformat of the above, cached so state reads don't re-render it
+        self._last_successful_update_iso: Optional[str] = None
         self._consecutive_stale_checks = 0
         self._recovery_in_progress = False
         self._heartbeat_unsub = None
@@ -97,6 +104,9 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="bytewatt",
             update_interval=timedelta(seconds=scan_interval),
+            # Skip entity callbacks when the returned dict is unchanged so an
+            # idle battery doesn't rewrite ~30 entity states every poll.
+            always_update=False,
         )
 
     
@@ -179,6 +189,14 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
             if battery_data:
                 self._last_battery_data = battery_data
                 self._last_successful_update = current_time
+                self._last_successful_update_iso = current_time.isoformat()
+                # Tell the last-update sensor about every success: the
+                # coordinator's own notification is deduplicated under
+                # always_update=False, so an unchanged battery dict would
+                # otherwise leave its timestamp stale
+                async_dispatcher_send(
+                    self.hass, f"{SIGNAL_SUCCESSFUL_UPDATE}_{self.entry_id}"
+                )
                 self._consecutive_stale_checks = 0
                 self._recovery_attempts = 0  # Reset recovery attempts on successful update
                 
@@ -209,12 +227,14 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
                 except (AttributeError, TypeError):
                     _LOGGER.debug("Could not dismiss notification - may not exist yet")
             
-            # Return the data along with connection status
+            # Return the data along with connection status. No per-poll
+            # timestamp here: it would make every dict compare unequal and
+            # defeat always_update=False (the last-update sensor is driven
+            # by the success dispatcher signal instead).
             data = {
                 "battery": self._last_battery_data or {},
                 "connection_status": "connected" if battery_data else "partial",
                 "circuit_breaker": self.circuit_breaker.state.value,
-                "last_updated": current_time.isoformat()
             }
             
             _LOGGER.debug(f"Coordinator data refreshed with keys: {list(data.keys())}")
@@ -247,7 +267,7 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
                     "connection_status": "cached",
                     "cache_age": cache_age,
                     "circuit_breaker": self.circuit_breaker.state.value,
-                    "last_updated": self._last_successful_update.isoformat() if self._last_successful_update else "unknown"
+                    "last_updated": self._last_successful_update_iso or "unknown"
                 }
             else:
                 # Create error notification if enabled
@@ -1,5 +1,6 @@
 """Sensor platform for Byte-Watt integration."""
 import logging
+from itertools import chain
 from typing import Callable, Dict, Optional, Any
 from datetime import datetime, time  # <-- Added time import here
 
@@ -7,7 +8,8 @@ import homeassistant.util.dt as dt_util  # <-- Added for time parsing & localiza
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -23,6 +25,7 @@ from .const import (
     SENSOR_BATTERY_POWER,
     SENSOR_PV,
     SENSOR_LAST_UPDATE,
+    SIGNAL_SUCCESSFUL_UPDATE,
     SENSOR_TOTAL_SOLAR,
     SENSOR_TOTAL_FEED_IN,
     SENSOR_TOTAL_BATTERY_CHARGE,
@@ -51,6 +54,80 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor spec tables: (sensor_type, name, device_class, attribute, unit, icon).
+# async_setup_entry expands these in a tight loop instead of 28 hand-written
+# constructor calls.
+_SOC_SENSOR_SPECS = (
+    (SENSOR_SOC, "Battery Percentage", "battery", "soc", "%", "mdi:battery"),
+    (SENSOR_GRID_CONSUMPTION, "Grid Consumption", "power", "pgrid", "W",
+     "mdi:transmission-tower"),
+    (SENSOR_HOUSE_CONSUMPTION, "House Consumption", "power", "pload", "W",
+     "mdi:home-lightning-bolt"),
+    (SENSOR_BATTERY_POWER, "Battery Power", "power", "pbat", "W", "mdi:battery-charging"),
+    (SENSOR_PV, "PV Power", "power", "ppv", "W", "mdi:solar-power"),
+)
+
+# Energy sensors all use device_class "energy" and kWh for the Energy
+# Dashboard, so their specs carry just (sensor_type, name, attribute, icon).
+_ENERGY_SENSOR_SPECS = (
+    # Lifetime grid statistics
+    (SENSOR_TOTAL_SOLAR, "Total Solar Generation", "Total_Solar_Generation",
+     "mdi:solar-power"),
+    (SENSOR_TOTAL_FEED_IN, "Total Feed In", "Total_Feed_In",
+     "mdi:transmission-tower-export"),
+    (SENSOR_TOTAL_BATTERY_CHARGE, "Total Battery Charge", "Total_Battery_Charge",
+     "mdi:battery-charging"),
+    (SENSOR_PV_POWER_HOUSE, "PV Power to House", "PV_Power_House",
+     "mdi:solar-power-variant"),
+    (SENSOR_PV_CHARGING_BATTERY, "PV Charging Battery", "PV_Charging_Battery",
+     "mdi:solar-power-variant-outline"),
+    (SENSOR_TOTAL_HOUSE_CONSUMPTION, "Total House Consumption",
+     "Total_House_Consumption", "mdi:home-lightning-bolt"),
+    (SENSOR_GRID_BATTERY_CHARGE, "Grid Based Battery Charge",
+     "Grid_Based_Battery_Charge", "mdi:transmission-tower-import"),
+    (SENSOR_GRID_POWER_CONSUMPTION, "Grid Power Consumption",
+     "Grid_Power_Consumption", "mdi:transmission-tower"),
+    # Daily statistics
+    (SENSOR_PV_GENERATED_TODAY, "PV Generated Today", "PV_Generated_Today",
+     "mdi:solar-power"),
+    (SENSOR_CONSUMED_TODAY, "Consumed Today", "Consumed_Today",
+     "mdi:home-lightning-bolt"),
+    (SENSOR_FEED_IN_TODAY, "Feed In Today", "Feed_In_Today",
+     "mdi:transmission-tower-export"),
+    (SENSOR_GRID_IMPORT_TODAY, "Grid Import Today", "Grid_Import_Today",
+     "mdi:transmission-tower-import"),
+    (SENSOR_BATTERY_CHARGED_TODAY, "Battery Charged Today", "Battery_Charged_Today",
+     "mdi:battery-plus"),
+    (SENSOR_BATTERY_DISCHARGED_TODAY, "Battery Discharged Today",
+     "Battery_Discharged_Today", "mdi:battery-minus"),
+)
+
+_SETTINGS_SENSOR_SPECS = (
+    (SENSOR_DISCHARGE_START, "Discharge Start Time", "timestamp", "timeDisf1", "",
+     "mdi:battery-minus"),
+    (SENSOR_DISCHARGE_END, "Discharge End Time", "timestamp", "timeDise1", "",
+     "mdi:battery-minus-outline"),
+    (SENSOR_CHARGE_START, "Charge Start Time", "timestamp", "timeChaf1", "",
+     "mdi:battery-plus"),
+    (SENSOR_CHARGE_END, "Charge End Time", "timestamp", "timeChae1", "",
+     "mdi:battery-plus-outline"),
+    (SENSOR_MIN_SOC, "Minimum SOC", "battery", "batUseCap", "%", "mdi:battery-low"),
+    (SENSOR_CHARGE_CAP, "Battery Charge Cap", "battery", "batHighCap", "%",
+     "mdi:battery-high"),
+)
+
+# Daily percentage/impact metrics without a device class
+_DAILY_METRIC_SPECS = (
+    (SENSOR_SELF_CONSUMPTION, "Self Consumption", None, "Self_Consumption", "%",
+     "mdi:home-battery"),
+    (SENSOR_SELF_SUFFICIENCY, "Self Sufficiency", None, "Self_Sufficiency", "%",
+     "mdi:home-battery-outline"),
+    (SENSOR_TREES_PLANTED, "Trees Planted", None, "Trees_Planted", "trees", "mdi:tree"),
+    (SENSOR_CO2_REDUCTION, "CO2 Reduction", None, "CO2_Reduction_Tons", "tons",
+     "mdi:molecule-co2"),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -58,329 +135,69 @@ async def async_setup_entry(
 ):
     """Set up the Byte-Watt sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    
-    # Define SOC sensors
-    soc_sensors = [
-        ByteWattSensor(
-            coordinator, 
-            entry, 
-            SENSOR_SOC, 
-            "Battery Percentage", 
-            "battery", 
-            "soc", 
-            "%", 
-            "mdi:battery"
-        ),
-        ByteWattSensor(
-            coordinator, 
-            entry, 
-            SENSOR_GRID_CONSUMPTION, 
-            "Grid Consumption", 
-            "power", 
-            "pgrid", 
-            "W", 
-            "mdi:transmission-tower"
-        ),
-        ByteWattSensor(
-            coordinator, 
-            entry, 
-            SENSOR_HOUSE_CONSUMPTION, 
-            "House Consumption", 
-            "power", 
-            "pload", 
-            "W", 
-            "mdi:home-lightning-bolt"
-        ),
-        ByteWattSensor(
-            coordinator, 
-            entry, 
-            SENSOR_BATTERY_POWER, 
-            "Battery Power", 
-            "power", 
-            "pbat", 
-            "W", 
-            "mdi:battery-charging"
-        ),
-        ByteWattSensor(
-            coordinator, 
-            entry, 
-            SENSOR_PV, 
-            "PV Power", 
-            "power", 
-            "ppv", 
-            "W", 
-            "mdi:solar-power"
-        ),
-        ByteWattLastUpdateSensor(
-            coordinator, 
-            entry, 
-            SENSOR_LAST_UPDATE, 
-            "Last Update", 
-            "timestamp", 
-            "", 
-            "mdi:clock-outline",
-            entity_category=EntityCategory.DIAGNOSTIC
-        ),
-    ]
-    
-    # Define grid stats sensors - modified to use "energy" device_class for kWh sensors
-    grid_sensors = [
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_TOTAL_SOLAR, 
-            "Total Solar Generation", 
-            "energy",  # Changed to "energy" for Energy Dashboard
-            "Total_Solar_Generation", 
-            "kWh", 
-            "mdi:solar-power"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_TOTAL_FEED_IN, 
-            "Total Feed In", 
-            "energy",  # Changed to "energy" for Energy Dashboard
-            "Total_Feed_In", 
-            "kWh", 
-            "mdi:transmission-tower-export"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_TOTAL_BATTERY_CHARGE, 
-            "Total Battery Charge", 
-            "energy",  # Changed to "energy" for Energy Dashboard
-            "Total_Battery_Charge", 
-            "kWh", 
-            "mdi:battery-charging"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_PV_POWER_HOUSE, 
-            "PV Power to House", 
-            "energy",  # Changed to "energy" for Energy Dashboard
-            "PV_Power_House", 
-            "kWh", 
-            "mdi:solar-power-variant"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_PV_CHARGING_BATTERY, 
-            "PV Charging Battery", 
-            "energy",  # Changed to "energy" for Energy Dashboard
-            "PV_Charging_Battery", 
-            "kWh", 
-            "mdi:solar-power-variant-outline"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_TOTAL_HOUSE_CONSUMPTION, 
-            "Total House Consumption", 
-            "energy",  # Changed to "energy" for Energy Dashboard
-            "Total_House_Consumption", 
-            "kWh", 
-            "mdi:home-lightning-bolt"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_GRID_BATTERY_CHARGE, 
-            "Grid Based Battery Charge", 
-            "energy",  # Changed to "energy" for Energy Dashboard
-            "Grid_Based_Battery_Charge", 
-            "kWh", 
-            "mdi:transmission-tower-import"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_GRID_POWER_CONSUMPTION, 
-            "Grid Power Consumption", 
-            "energy",  # Changed to "energy" for Energy Dashboard
-            "Grid_Power_Consumption", 
-            "kWh", 
-            "mdi:transmission-tower"
-        ),
-    ]
-    
-    # Define battery settings sensors
-    battery_settings_sensors = [
-        ByteWattBatterySettingsSensor(
-            coordinator, 
-            entry, 
-            SENSOR_DISCHARGE_START, 
-            "Discharge Start Time", 
-            "timestamp", 
-            "timeDisf1", 
-            "", 
-            "mdi:battery-minus"
-        ),
-        ByteWattBatterySettingsSensor(
-            coordinator, 
-            entry, 
-            SENSOR_DISCHARGE_END, 
-            "Discharge End Time", 
-            "timestamp", 
-            "timeDise1", 
-            "", 
-            "mdi:battery-minus-outline"
-        ),
-        ByteWattBatterySettingsSensor(
-            coordinator, 
-            entry, 
-            SENSOR_CHARGE_START, 
-            "Charge Start Time", 
-            "timestamp", 
-            "timeChaf1", 
-            "", 
-            "mdi:battery-plus"
-        ),
-        ByteWattBatterySettingsSensor(
-            coordinator, 
-            entry, 
-            SENSOR_CHARGE_END, 
-            "Charge End Time", 
-            "timestamp", 
-            "timeChae1", 
-            "", 
-            "mdi:battery-plus-outline"
-        ),
-        ByteWattBatterySettingsSensor(
-            coordinator, 
-            entry, 
-            SENSOR_MIN_SOC, 
-            "Minimum SOC", 
-            "battery", 
-            "batUseCap", 
-            "%", 
-            "mdi:battery-low"
-        ),
-        ByteWattBatterySettingsSensor(
-            coordinator, 
-            entry, 
-            SENSOR_CHARGE_CAP, 
-            "Battery Charge Cap", 
-            "battery", 
-            "batHighCap", 
-            "%", 
-            "mdi:battery-high"
-        ),
-    ]
-    
-    # Define daily stats sensors
-    daily_stats_sensors = [
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_PV_GENERATED_TODAY, 
-            "PV Generated Today", 
-            "energy",
-            "PV_Generated_Today", 
-            "kWh", 
-            "mdi:solar-power"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_CONSUMED_TODAY, 
-            "Consumed Today", 
-            "energy",
-            "Consumed_Today", 
-            "kWh", 
-            "mdi:home-lightning-bolt"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_FEED_IN_TODAY, 
-            "Feed In Today", 
-            "energy",
-            "Feed_In_Today", 
-            "kWh", 
-            "mdi:transmission-tower-export"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_GRID_IMPORT_TODAY, 
-            "Grid Import Today", 
-            "energy",
-            "Grid_Import_Today", 
-            "kWh", 
-            "mdi:transmission-tower-import"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_BATTERY_CHARGED_TODAY, 
-            "Battery Charged Today", 
-            "energy",
-            "Battery_Charged_Today", 
-            "kWh", 
-            "mdi:battery-plus"
-        ),
-        ByteWattGridSensor(
-            coordinator, 
-            entry, 
-            SENSOR_BATTERY_DISCHARGED_TODAY, 
-            "Battery Discharged Today", 
-            "energy",
-            "Battery_Discharged_Today", 
-            "kWh", 
-            "mdi:battery-minus"
+
+    def _update_available_keys() -> None:
+        """Rebuild the shared key index once per refresh for availability checks."""
+        data = coordinator.data
+        battery_data = data.get("battery") if data else None
+        coordinator._available_keys = frozenset(battery_data) if battery_data else frozenset()
+
+    _update_available_keys()
+    entry.async_on_unload(coordinator.async_add_listener(_update_available_keys))
+
+    # All entities for an entry share one device, so build its info dict once
+    username = entry.data.get("username", "Unknown") if entry.data else "Unknown"
+    device_info = {
+        "identifiers": {(DOMAIN, entry.entry_id)},
+        "name": f"Byte-Watt Battery ({username})",
+        "manufacturer": "Byte-Watt",
+        "model": "Battery Monitor",
+    }
+
+    # Chain generators so entities are constructed as the platform consumes
+    # them in a single async_add_entities pass, without an intermediate list
+    async_add_entities(chain(
+        (
+            ByteWattSensor(coordinator, entry, *spec, device_info=device_info)
+            for spec in _SOC_SENSOR_SPECS
         ),
-        ByteWattSensor(
-            coordinator, 
-            entry, 
-            SENSOR_SELF_CONSUMPTION, 
-            "Self Consumption", 
-            None,  # No device class for percentage
-            "Self_Consumption", 
-            "%", 
-            "mdi:home-battery"
+        (
+            ByteWattLastUpdateSensor(
+                coordinator,
+                entry,
+                SENSOR_LAST_UPDATE,
+                "Last Update",
+                "timestamp",
+                "",
+                "mdi:clock-outline",
+                entity_category=EntityCategory.DIAGNOSTIC,
+                device_info=device_info,
+            ),
         ),
-        ByteWattSensor(
-            coordinator, 
-            entry, 
-            SENSOR_SELF_SUFFICIENCY, 
-            "Self Sufficiency", 
-            None,  # No device class for percentage
-            "Self_Sufficiency", 
-            "%", 
-            "mdi:home-battery-outline"
+        (
+            ByteWattGridSensor(coordinator, entry, sensor_type, name, "energy",
+                               attribute, "kWh", icon, device_info=device_info)
+            for sensor_type, name, attribute, icon in _ENERGY_SENSOR_SPECS
         ),
-        ByteWattSensor(
-            coordinator, 
-            entry, 
-            SENSOR_TREES_PLANTED, 
-            "Trees Planted", 
-            None,
-            "Trees_Planted", 
-            "trees", 
-            "mdi:tree"
+        (
+            ByteWattBatterySettingsSensor(coordinator, entry, *spec,
+                                          device_info=device_info)
+            for spec in _SETTINGS_SENSOR_SPECS
         ),
-        ByteWattSensor(
-            coordinator, 
-            entry, 
-            SENSOR_CO2_REDUCTION, 
-            "CO2 Reduction", 
-            None,
-            "CO2_Reduction_Tons", 
-            "tons", 
-            "mdi:molecule-co2"
+        (
+            ByteWattSensor(coordinator, entry, *spec, device_info=device_info)
+            for spec in _DAILY_METRIC_SPECS
         ),
-    ]
-    
-    async_add_entities(soc_sensors + grid_sensors + battery_settings_sensors + daily_stats_sensors)
+    ))
 
 
 class ByteWattSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Byte-Watt Sensor."""
 
+    # Slot our own attributes so hot native_value reads are C-level slot
+    # fetches (the HA base classes still provide a __dict__ for _attr_*).
+    __slots__ = ("_config_entry", "_sensor_type", "_attribute", "_is_power")
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -392,132 +209,87 @@ class ByteWattSensor(CoordinatorEntity, SensorEntity):
         unit: str,
         icon: str,
         entity_category: Optional[EntityCategory] = None,
+        device_info: Optional[Dict[str, Any]] = None,
     ):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
         self._sensor_type = sensor_type
         self._attribute = attribute
+        self._is_power = device_class == "power"
         self._attr_name = name
         self._attr_unique_id = f"{config_entry.entry_id}_{sensor_type}"
         self._attr_device_class = device_class
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
         self._attr_entity_category = entity_category
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        # Safely get username from config entry data
-        username = "Unknown"
-        if self._config_entry.data:
-            username = self._config_entry.data.get('username', 'Unknown')
-        
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": f"Byte-Watt Battery ({username})",
-            "manufacturer": "Byte-Watt",
-            "model": "Battery Monitor",
-        }
+        # Shared per-entry dict built once in async_setup_entry
+        self._attr_device_info = device_info
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        try:
-            if not self.coordinator.data or "battery" not in self.coordinator.data:
-                return None
-            
-            battery_data = self.coordinator.data["battery"]
-            value = battery_data.get(self._attribute)
-            
-            if value is None:
-                # First time encountering a missing attribute, log it at info level 
-                # to help with troubleshooting new API responses
-                _LOGGER.debug(
-                    f"Attribute '{self._attribute}' not found in battery data for {self._attr_name}. "
-                    f"Available attributes: {list(battery_data.keys())}"
-                )
-                return None
-                
-            # Return the value, converting string values to float if needed for numerical sensors
-            if self._attr_device_class == "power" and isinstance(value, (str, int, float)):
-                try:
-                    return float(value)
-                except (ValueError, TypeError):
-                    return value
-            return value
-        except Exception as ex:
-            _LOGGER.error(f"Error getting sensor state for {self._attr_name}: {ex}")
+        data = self.coordinator.data
+        battery_data = data.get("battery") if data else None
+        if battery_data is None:
             return None
 
+        value = battery_data.get(self._attribute)
+        if value is None:
+            # Log missing attributes at debug level to help with
+            # troubleshooting new API responses
+            _LOGGER.debug(
+                f"Attribute '{self._attribute}' not found in battery data for {self._attr_name}. "
+                f"Available attributes: {list(battery_data.keys())}"
+            )
+            return None
+
+        # Return the value, converting string values to float if needed for numerical sensors
+        if self._is_power:
+            try:
+                return float(value)
+            except (ValueError, TypeError):
+                return value
+        return value
+
 
 class ByteWattGridSensor(ByteWattSensor):
     """Representation of a Byte-Watt Grid Sensor."""
 
-    def __init__(
-        self,
-        coordinator,
-        config_entry,
-        sensor_type,
-        name,
-        device_class,
-        attribute,
-        unit,
-        icon,
-        entity_category=None,
-    ):
-        """Initialize the sensor."""
-        super().__init__(
-            coordinator, 
-            config_entry, 
-            sensor_type, 
-            name, 
-            device_class, 
-            attribute, 
-            unit, 
-            icon,
-            entity_category
-        )
-        # Add state_class for energy sensors (kWh)
-        if unit == "kWh":
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+    __slots__ = ()
+
+    # Every grid sensor reports kWh for the Energy Dashboard
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        try:
-            if not self.coordinator.data or "battery" not in self.coordinator.data:
-                return None
-            
-            # In the new API, all data is in the battery object
-            # Try to find matching attributes in the battery data
-            battery_data = self.coordinator.data["battery"]
-            
-            # Handle special case for energy metrics which may be in a different format
-            if self._attribute in battery_data:
-                return battery_data.get(self._attribute)
-            
-            # If data isn't available, we'll log it at debug level
-            _LOGGER.debug(f"Grid sensor {self._attribute} data not found in battery response")
-            return None
-        except Exception as ex:
-            _LOGGER.error(f"Error getting grid sensor state: {ex}")
+        # In the new API, all data is in the battery object
+        data = self.coordinator.data
+        battery_data = data.get("battery") if data else None
+        if battery_data is None:
             return None
-            
+
+        if self._attribute in battery_data:
+            return battery_data[self._attribute]
+
+        # If data isn't available, we'll log it at debug level
+        _LOGGER.debug(f"Grid sensor {self._attribute} data not found in battery response")
+        return None
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # Many grid sensors may not be available in the new API
-        if not self.coordinator.data or "battery" not in self.coordinator.data:
-            return False
-            
-        # Check if this attribute exists in the data
-        return self._attribute in self.coordinator.data["battery"]
+        # Many grid sensors may not be available in the new API; check the
+        # key index rebuilt once per refresh instead of the battery dict
+        return self._attribute in self.coordinator._available_keys
 
 
 class ByteWattLastUpdateSensor(ByteWattSensor):
     """Representation of a Byte-Watt Last Update Sensor that doesn't rely on createTime."""
-    
+
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator,
@@ -528,40 +300,70 @@ class ByteWattLastUpdateSensor(ByteWattSensor):
         unit,
         icon,
         entity_category=None,
+        device_info=None,
     ):
         """Initialize the Last Update sensor."""
         super().__init__(
-            coordinator, 
-            config_entry, 
-            sensor_type, 
-            name, 
-            device_class, 
+            coordinator,
+            config_entry,
+            sensor_type,
+            name,
+            device_class,
             "last_update",  # Use a custom attribute name
-            unit, 
+            unit,
             icon,
-            entity_category
+            entity_category,
+            device_info,
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator's per-success dispatcher signal.
+
+        With always_update=False the coordinator skips listener callbacks
+        when the data dict is unchanged, which is exactly when this
+        timestamp still needs to advance.
+        """
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{SIGNAL_SUCCESSFUL_UPDATE}_{self._config_entry.entry_id}",
+                self._handle_successful_update,
+            )
+        )
+
+    @callback
+    def _handle_successful_update(self) -> None:
+        """Write state after every successful refresh, changed data or not."""
+        self.async_write_ha_state()
+
     @property
     def native_value(self):
         """Return the last update time based on coordinator's last successful update."""
-        try:
-            if hasattr(self.coordinator, '_last_successful_update') and self.coordinator._last_successful_update:
-                return self.coordinator._last_successful_update.isoformat()
-            return None
-        except Exception as ex:
-            _LOGGER.error(f"Error getting last update time: {ex}")
-            return None
-    
+        # The coordinator caches the rendered isoformat string whenever it
+        # records a successful update, so state reads just return it
+        return self.coordinator._last_successful_update_iso
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return hasattr(self.coordinator, '_last_successful_update') and self.coordinator._last_successful_update is not None
+        return self.coordinator._last_successful_update is not None
 
 
 class ByteWattBatterySettingsSensor(ByteWattSensor):
     """Representation of a Byte-Watt Battery Settings Sensor."""
-    
+
+    __slots__ = ("_api_client", "_settings_attr", "_time_iso_cache")
+
+    # API-style attribute names mapped to their BatterySettings field names;
+    # anything not listed is looked up under its own name.
+    _ATTR_MAP = {
+        "timeDisf1": "time_disf1a",
+        "timeDise1": "time_dise1a",
+        "timeChaf1": "time_chaf1a",
+        "timeChae1": "time_chae1a",
+    }
+
     def __init__(
         self,
         coordinator,
@@ -573,19 +375,26 @@ class ByteWattBatterySettingsSensor(ByteWattSensor):
         unit,
         icon,
         entity_category=None,
+        device_info=None,
     ):
         """Initialize the sensor with settings data."""
         super().__init__(
-            coordinator, 
-            config_entry, 
-            sensor_type, 
-            name, 
-            device_class, 
-            attribute, 
-            unit, 
+            coordinator,
+            config_entry,
+            sensor_type,
+            name,
+            device_class,
+            attribute,
+            unit,
             icon,
-            entity_category
+            entity_category,
+            device_info,
         )
+        # Resolved lazily on first state read; hass isn't attached yet here
+        self._api_client = None
+        self._settings_attr = self._ATTR_MAP.get(attribute, attribute)
+        # (value, date, iso_string) of the last converted time setting
+        self._time_iso_cache = None
         # Initialize directly here to avoid attribute access errors
         try:
             # Make sure the client we'll access has the attribute to avoid errors
@@ -595,43 +404,44 @@ class ByteWattBatterySettingsSensor(ByteWattSensor):
         except Exception as ex:
             _LOGGER.debug(f"Error initializing settings cache: {ex}")
 
+    def _get_api_client(self):
+        """Return the underlying API client, resolving the hass.data chain once."""
+        api_client = self._api_client
+        if api_client is None:
+            entry_data = self.hass.data[DOMAIN][self._config_entry.entry_id]
+            api_client = self._api_client = entry_data["client"].api_client
+        return api_client
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
         try:
             # Get settings from the client's settings cache
-            client = self.hass.data[DOMAIN][self._config_entry.entry_id]["client"]
-            if hasattr(client.api_client, "_settings_cache") and client.api_client._settings_cache:
-                settings = client.api_client._settings_cache
-                
-                val = None
-                if self._attribute == "timeDisf1":
-                    val = getattr(settings, "time_disf1a", None)
-                elif self._attribute == "timeDise1":
-                    val = getattr(settings, "time_dise1a", None)
-                elif self._attribute == "timeChaf1":
-                    val = getattr(settings, "time_chaf1a", None)
-                elif self._attribute == "timeChae1":
-                    val = getattr(settings, "time_chae1a", None)
-                elif self._attribute == "batUseCap":
-                    val = getattr(settings, "batUseCap", None)
-                elif self._attribute == "batHighCap":
-                    val = getattr(settings, "batHighCap", None)
-                else:
-                    val = getattr(settings, self._attribute, None)
+            settings = getattr(self._get_api_client(), "_settings_cache", None)
+            if settings:
                 
+                val = getattr(settings, self._settings_attr, None)
+
                 if val is None:
                     return None
 
                 # Special handling: if it's a time string like "07:00" convert to datetime
                 if isinstance(val, str) and ":" in val:
-                    # Convert string time like "07:00" to a localized datetime object for HA
+                    # Convert string time like "07:00" to a localized datetime for HA.
+                    # The result only changes with the value or the date, so reuse
+                    # the cached ISO string instead of re-parsing every poll
+                    # (strptime is far too slow for a per-tick hot path).
                     try:
-                        dt_obj = datetime.strptime(val, "%H:%M").time()
-                        # Return localized datetime, today with that time
                         today = dt_util.now().date()
+                        cached = self._time_iso_cache
+                        if cached and cached[0] == val and cached[1] == today:
+                            return cached[2]
+                        hours, _, minutes = val.partition(":")
+                        dt_obj = time(int(hours), int(minutes))
                         dt_localized = dt_util.as_local(datetime.combine(today, dt_obj))
-                        return dt_localized.isoformat()
+                        iso_value = dt_localized.isoformat()
+                        self._time_iso_cache = (val, today, iso_value)
+                        return iso_value
                     except Exception as e:
                         _LOGGER.error(f"Error parsing time string '{val}' for sensor {self._attr_name}: {e}")
                         return val
@@ -649,8 +459,7 @@ class ByteWattBatterySettingsSensor(ByteWattSensor):
     def available(self) -> bool:
         """Return if entity is available."""
         try:
-            client = self.hass.data[DOMAIN][self._config_entry.entry_id]["client"]
-            return hasattr(client.api_client, "_settings_cache") and bool(client.api_client._settings_cache)
+            return bool(getattr(self._get_api_client(), "_settings_cache", None))
         except Exception as ex:
             _LOGGER.debug(f"Error checking availability for {self._attr_name}: {ex}")
             return False
@@ -1,14 +1,19 @@
 """Time utilities for the Byte-Watt integration."""
 import re
 import logging
+from functools import lru_cache
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
 def sanitize_time_format(time_str):
     """
     Sanitize time format to ensure it's in HH:MM format.
-    
+
+    Results are memoized: automations re-submit the same canonical strings
+    (e.g. "23:00"), so repeat calls skip the regex matching entirely.
+
     Args:
         time_str: Time string to sanitize
         